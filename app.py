@@ -8,11 +8,19 @@ Features:
 import sys
 from pathlib import Path
 from flask import Flask, render_template, request, jsonify, send_file, redirect, url_for
+from flask.json.provider import DefaultJSONProvider
 from werkzeug.utils import secure_filename
 import os
 from datetime import datetime
 import json
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
 # Add project root to path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
@@ -24,6 +32,7 @@ from src.vector_db.search_engine import HybridSearchEngine
 from src.document_processing.loaders import DocumentLoaderFactory
 from src.document_processing.code_loader import load_framework_repository
 from src.utils.logger import setup_logger
+from src.utils.azure_llm import get_openai_client
 from src.utils.job_manager import JobManager
 from src.simple_testgen import SimpleTestGenerator
 from src.script_generator import ScriptGenerator
@@ -32,8 +41,41 @@ from src.framework_expert import FrameworkExpert
 
 logger = setup_logger(__name__)
 
+_JSON_DECODER = json.JSONDecoder()
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson, falling back to the stdlib for unsupported types."""
+
+    # Datetimes pass through to Flask's default so they keep the HTTP-date format.
+    _OPTIONS = (
+        orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if orjson else 0
+    )
+
+    # Compact output is what orjson emits; jsonify() passes these separators outside debug mode
+    _COMPACT_SEPARATORS = (",", ":")
+
+    def dumps(self, obj, **kwargs):
+        # Other formatting options (e.g. indent in debug mode) go to the stdlib
+        separators = kwargs.get("separators", self._COMPACT_SEPARATORS)
+        if set(kwargs) - {"separators"} or separators != self._COMPACT_SEPARATORS:
+            return super().dumps(obj, **kwargs)
+        try:
+            return orjson.dumps(obj, default=self.default, option=self._OPTIONS).decode()
+        except TypeError:
+            return super().dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+
 # Initialize Flask app
 app = Flask(__name__)
+if orjson is not None:
+    app.json = ORJSONProvider(app)
 app.config['SECRET_KEY'] = 'your-secret-key-here'
 app.config['UPLOAD_FOLDER'] = str(config.DATA_DIR / 'uploads')
 app.config['MAX_CONTENT_LENGTH'] = 50 * 1024 * 1024  # 50MB max file size
@@ -63,14 +105,9 @@ def init_components():
         framework_loader = FrameworkLoader()
 
         # Initialize Framework Expert and Domain Expert with Azure OpenAI client
-        from openai import AzureOpenAI
         from src.domain_expert import DomainExpert
 
-        azure_client = AzureOpenAI(
-            api_version=config.AZURE_OPENAI_API_VERSION,
-            azure_endpoint=config.AZURE_OPENAI_ENDPOINT,
-            api_key=config.AZURE_OPENAI_API_KEY
-        )
+        azure_client = get_openai_client()
         framework_expert = FrameworkExpert(azure_client, framework_loader)
 
         # Initialize Domain Expert for documentation understanding
@@ -85,6 +122,28 @@ def init_components():
     except Exception as e:
         logger.error(f"Error initializing components: {e}")
 
+    _prerender_error_pages()
+
+
+# Rendered error pages, filled by _prerender_error_pages()
+_ERROR_PAGES = {}
+
+
+def _prerender_error_pages():
+    """
+    Render the static 404/500 pages once so error handlers skip Jinja.
+
+    The pages only depend on url_for() and request.endpoint, so rendering
+    them in a request context for an unrouted path (endpoint None) gives
+    exactly what a real miss would.
+    """
+    try:
+        with app.test_request_context('/__error_page__'):
+            for code in (404, 500):
+                _ERROR_PAGES[code] = render_template(f'{code}.html')
+    except Exception as e:
+        logger.warning(f"Could not pre-render error pages: {e}")
+
 # ============================================================================
 # HOME ROUTES
 # ============================================================================
@@ -122,7 +181,7 @@ def upload_document():
 
         # Check file extension
         file_ext = Path(file.filename).suffix.lower()
-        if file_ext not in config.SUPPORTED_FORMATS:
+        if file_ext not in config.SUPPORTED_FORMATS_SET:
             return jsonify({
                 'success': False,
                 'error': f'Unsupported format. Supported: {", ".join(config.SUPPORTED_FORMATS)}'
@@ -328,9 +387,7 @@ def extract_pkg():
         if not end_page:
             end_page = getattr(doc_info, 'total_pages', 100)
 
-        # Import PKG extraction functions
-        import sys
-        sys.path.insert(0, str(Path(__file__).parent))
+        # Import PKG extraction functions (project_root is already on sys.path)
         from extract_pkg_enhanced import (
             extract_pdf_pages,
             discover_features_with_page_locations,
@@ -982,17 +1039,12 @@ def generate_custom_script():
         from src.framework_loader import FrameworkLoader
         from src.framework_expert import FrameworkExpert
         from src.demo_suite_loader import load_demo_suite
-        from openai import AzureOpenAI
 
         # Initialize framework loader for the selected framework
         temp_framework_loader = FrameworkLoader(framework_type=framework_type)
 
         # Initialize Azure client
-        azure_client = AzureOpenAI(
-            api_version=config.AZURE_OPENAI_API_VERSION,
-            azure_endpoint=config.AZURE_OPENAI_ENDPOINT,
-            api_key=config.AZURE_OPENAI_API_KEY
-        )
+        azure_client = get_openai_client()
 
         # Initialize framework expert with the specific loader and framework type
         temp_framework_expert = FrameworkExpert(azure_client, temp_framework_loader, framework_type=framework_type)
@@ -1053,12 +1105,7 @@ def get_knowledge_stats():
         framework_type = request.args.get('framework_type', 'pstaff')
 
         # Create framework expert for specific framework type
-        from openai import AzureOpenAI
-        azure_client = AzureOpenAI(
-            api_version=config.AZURE_OPENAI_API_VERSION,
-            azure_endpoint=config.AZURE_OPENAI_ENDPOINT,
-            api_key=config.AZURE_OPENAI_API_KEY
-        )
+        azure_client = get_openai_client()
         temp_framework_loader = FrameworkLoader(framework_type=framework_type)
         temp_framework_expert = FrameworkExpert(azure_client, temp_framework_loader, framework_type=framework_type)
 
@@ -1101,12 +1148,7 @@ def ingest_framework_files():
             return jsonify({'success': False, 'error': 'No valid files found'}), 400
 
         # Create framework expert for specific framework type
-        from openai import AzureOpenAI
-        azure_client = AzureOpenAI(
-            api_version=config.AZURE_OPENAI_API_VERSION,
-            azure_endpoint=config.AZURE_OPENAI_ENDPOINT,
-            api_key=config.AZURE_OPENAI_API_KEY
-        )
+        azure_client = get_openai_client()
         temp_framework_loader = FrameworkLoader(framework_type=framework_type)
         temp_framework_expert = FrameworkExpert(azure_client, temp_framework_loader, framework_type=framework_type)
 
@@ -1145,12 +1187,7 @@ def analyze_framework_api():
         logger.info(f"Starting {framework_type} framework analysis (force={force_reanalysis})...")
 
         # Create framework expert for specific framework type
-        from openai import AzureOpenAI
-        azure_client = AzureOpenAI(
-            api_version=config.AZURE_OPENAI_API_VERSION,
-            azure_endpoint=config.AZURE_OPENAI_ENDPOINT,
-            api_key=config.AZURE_OPENAI_API_KEY
-        )
+        azure_client = get_openai_client()
         temp_framework_loader = FrameworkLoader(framework_type=framework_type)
         temp_framework_expert = FrameworkExpert(azure_client, temp_framework_loader, framework_type=framework_type)
 
@@ -1173,6 +1210,82 @@ def analyze_framework_api():
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+def _extract_json(text: str) -> dict:
+    """Parse the first JSON object embedded in an LLM response.
+
+    Decodes directly from the first '{' so markdown fences and trailing
+    commentary around the object are ignored.
+
+    Args:
+        text: Raw LLM response text
+
+    Returns:
+        Parsed dict, or an empty dict if no valid JSON object is found
+    """
+    start = text.find('{')
+    if start < 0:
+        return {}
+    try:
+        obj, _ = _JSON_DECODER.raw_decode(text, start)
+    except json.JSONDecodeError:
+        return {}
+    return obj if isinstance(obj, dict) else {}
+
+
+def _read_streamed_json(stream) -> str:
+    """Accumulate a streamed chat completion, stopping once the first JSON object closes.
+
+    Braces are counted outside of string literals; as soon as the top-level
+    object is balanced the stream is closed, so trailing fences or commentary
+    are never downloaded. If no complete object arrives, the full text is returned.
+
+    Args:
+        stream: Iterator of chat completion chunks (create(..., stream=True))
+
+    Returns:
+        The JSON object text, or the whole response text as a fallback
+    """
+    buf = bytearray()
+    start = -1
+    depth = 0
+    in_string = False
+    escaped = False
+
+    for chunk in stream:
+        if not chunk.choices:  # Azure sends content-filter-only chunks
+            continue
+        delta = chunk.choices[0].delta.content
+        if not delta:
+            continue
+
+        offset = len(buf)
+        data = delta.encode('utf-8')
+        buf.extend(data)
+
+        for i, byte in enumerate(data, offset):
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif byte == 0x5C:  # backslash
+                    escaped = True
+                elif byte == 0x22:  # closing quote
+                    in_string = False
+            elif byte == 0x22:
+                if start >= 0:
+                    in_string = True
+            elif byte == 0x7B:  # {
+                if start < 0:
+                    start = i
+                depth += 1
+            elif byte == 0x7D and start >= 0:  # }
+                depth -= 1
+                if depth == 0:
+                    stream.close()
+                    return buf[start:i + 1].decode('utf-8')
+
+    return buf.decode('utf-8')
+
+
 def _generate_framework_aware_script(description: str, test_name: str, framework_context: str,
                                       framework_type: str = 'pstaff', demo_suite: str = '') -> dict:
     """Generate framework-specific test files (PSTAFF or Client framework)
@@ -1187,13 +1300,7 @@ def _generate_framework_aware_script(description: str, test_name: str, framework
     Returns:
         dict with keys: 'robot_file', 'python_file', 'data_file', 'feature_name', 'generation_feedback'
     """
-    from openai import AzureOpenAI
-
-    client = AzureOpenAI(
-        api_version=config.AZURE_OPENAI_API_VERSION,
-        azure_endpoint=config.AZURE_OPENAI_ENDPOINT,
-        api_key=config.AZURE_OPENAI_API_KEY
-    )
+    client = get_openai_client()
 
     # Extract feature name from test_name for file naming
     # e.g., test_admin_login_functionality -> Admin_Login_Functionality
@@ -1576,7 +1683,7 @@ Generate all three files now with feedback:"""
                 {"role": "system", "content": system_message},
                 {"role": "user", "content": prompt}
             ],
-            max_completion_tokens=8000,
+            max_completion_tokens=config.FRAMEWORK_SCRIPT_MAX_TOKENS,
             temperature=0.3
         )
 
@@ -1604,15 +1711,10 @@ Generate all three files now with feedback:"""
                         parts3 = parts2.split("=== FILE 3: TEST RUNNER FILE ===")[1]
                         if "=== GENERATION FEEDBACK ===" in parts3:
                             robot_file = parts3.split("=== GENERATION FEEDBACK ===")[0].strip()  # Test runner goes to robot_file
-                            feedback_text = parts3.split("=== GENERATION FEEDBACK ===")[1].strip()
-                            try:
-                                if '```json' in feedback_text:
-                                    feedback_text = feedback_text.split('```json')[1].split('```')[0].strip()
-                                elif '```' in feedback_text:
-                                    feedback_text = feedback_text.split('```')[1].split('```')[0].strip()
-                                generation_feedback = json.loads(feedback_text)
-                            except json.JSONDecodeError as e:
-                                logger.warning(f"Failed to parse generation feedback: {e}")
+                            feedback_text = parts3.split("=== GENERATION FEEDBACK ===")[1]
+                            generation_feedback = _extract_json(feedback_text)
+                            if not generation_feedback:
+                                logger.warning("Failed to parse generation feedback")
                                 generation_feedback = {"overall_confidence": 75, "assumptions": [], "uncertainties": []}
                         else:
                             robot_file = parts3.strip()
@@ -1633,15 +1735,10 @@ Generate all three files now with feedback:"""
                         parts3 = parts2.split("=== FILE 3: DATA FILE ===")[1]
                         if "=== GENERATION FEEDBACK ===" in parts3:
                             data_file = parts3.split("=== GENERATION FEEDBACK ===")[0].strip()
-                            feedback_text = parts3.split("=== GENERATION FEEDBACK ===")[1].strip()
-                            try:
-                                if '```json' in feedback_text:
-                                    feedback_text = feedback_text.split('```json')[1].split('```')[0].strip()
-                                elif '```' in feedback_text:
-                                    feedback_text = feedback_text.split('```')[1].split('```')[0].strip()
-                                generation_feedback = json.loads(feedback_text)
-                            except json.JSONDecodeError as e:
-                                logger.warning(f"Failed to parse generation feedback: {e}")
+                            feedback_text = parts3.split("=== GENERATION FEEDBACK ===")[1]
+                            generation_feedback = _extract_json(feedback_text)
+                            if not generation_feedback:
+                                logger.warning("Failed to parse generation feedback")
                                 generation_feedback = {"overall_confidence": 75, "assumptions": [], "uncertainties": []}
                         else:
                             data_file = parts3.strip()
@@ -1676,102 +1773,23 @@ Generate all three files now with feedback:"""
         raise
 
 
-def _review_generated_code(files: dict, test_description: str, framework_type: str = 'pstaff') -> dict:
-    """
-    Review generated code for quality, potential issues, and provide ratings
-
-    Args:
-        files: Dictionary containing robot_file, python_file, data_file
-        test_description: Original test case description
-        framework_type: 'pstaff' or 'client'
-
-    Returns:
-        Dictionary with review results, ratings, issues, and recommendations
-    """
-    from openai import AzureOpenAI
-
-    client = AzureOpenAI(
-        api_version=config.AZURE_OPENAI_API_VERSION,
-        azure_endpoint=config.AZURE_OPENAI_ENDPOINT,
-        api_key=config.AZURE_OPENAI_API_KEY
-    )
-
-    # Framework-specific review prompts
-    framework_specifics = ""
-    if framework_type == 'client':
-        framework_specifics = """
-FRAMEWORK-SPECIFIC VALIDATION (Client Framework - aut-pypdc):
-- Does this follow aut-pypdc pytest patterns and PPS module conventions?
-- Are PpsRestClient methods (loginSA, put, get, post, delete) used correctly?
-- Is FWUtils used properly for configuration management?
-- Do test functions follow TC_<ID>_PPS_<NAME>() naming pattern?
-- Does the test runner use pytest conventions (test_* functions)?
-- Are admin_pps modules (PpsRestUtils, authentication, etc.) imported correctly?
-- Is logging done correctly with log.info() for test steps?
-"""
-    else:
-        framework_specifics = """
-FRAMEWORK-SPECIFIC VALIDATION (PSTAFF - aut-pstaf):
-- Does this follow PSTAF naming conventions and patterns?
-- Are Robot Framework keyword names descriptive and follow library conventions?
-- Are PSTAF utility methods (ConfigUtils, AppAccess, BrowserActions) used correctly?
-- Are dependencies used as documented in framework examples?
-"""
-
-    review_prompt = f"""You are a senior code reviewer specializing in test automation quality assurance.
-
-Review the following generated test files for quality, correctness, and potential issues.
-
-Framework: {framework_type.upper()}
-
-ORIGINAL TEST REQUIREMENT:
-{test_description}
-
-GENERATED FILES:
-
-=== {files['feature_name']}.robot ===
-{files['robot_file']}
-
-=== {files['feature_name']}.py ===
-{files['python_file']}
-
-=== {files['feature_name']}_Data.py ===
-{files['data_file']}
-
-REVIEW CRITERIA:
-1. **Correctness**: Does the code correctly implement the test requirement? What percentage of requirements are covered?
-2. **Framework Compliance**: Does it follow Robot Framework and PSTAF framework best practices and naming conventions?
-3. **Code Quality**: Is the code clean, maintainable, well-structured, and free of code smells?
-4. **Error Handling**: Are errors properly handled with appropriate fallbacks and logging?
-5. **Data Management**: Is test data properly separated, validated, and managed?
-6. **Best Practices**: Does it follow testing best practices including proper assertions and cleanup?
-7. **Test Coverage**: What scenarios are NOT covered? What edge cases, negative paths, and error conditions are missing?
-8. **Security**: Are there any security vulnerabilities (credential exposure, injection risks, etc.)?
-
-SEVERITY LEVEL GUIDELINES - BE PRECISE:
-- **critical**: Security vulnerabilities (exposed credentials, SQL injection, XSS), data corruption, system crashes, infinite loops, authentication bypasses
-- **high**: Race conditions, memory leaks, incorrect core logic, missing critical error handling, data loss risks
-- **medium**: Hardcoded values that should be configurable, poor error messages, missing input validation, code that works but is fragile
-- **low**: Code style issues, unused variables, minor redundancy, missing comments
-- **info**: Suggestions for future enhancements, alternative approaches
-
-{framework_specifics}
+# Invariant part of the code review prompt (output schema, rules, rating scale).
+# Built once at import; _review_generated_code only formats the per-call head.
+_REVIEW_PROMPT_TAIL = """Provide a comprehensive review in the following JSON format:
 
-Provide a comprehensive review in the following JSON format:
-
-{{
+{
   "overall_rating": "B+",
   "confidence_score": 87,
   "rating_explanation": "Overall B+ because Python file (50% weight) has 2 medium-severity issues affecting robustness. Robot file is excellent (A-) and data file is clean (A-). No critical or high-severity issues found.",
   "what_would_make_it_A": "Fix the 2 MEDIUM issues: (1) Add config fallbacks for missing values, (2) Replace bare except clauses with specific exception handling. Estimated total effort: 20 minutes.",
 
-  "file_ratings": {{
+  "file_ratings": {
     "robot_file": "A-",
     "python_file": "B+",
     "data_file": "A-"
-  }},
+  },
 
-  "test_coverage_gaps": {{
+  "test_coverage_gaps": {
     "missing_scenarios": [
       "Negative test: Invalid credentials",
       "Edge case: Network timeout during login",
@@ -1784,30 +1802,30 @@ Provide a comprehensive review in the following JSON format:
     ],
     "requirement_coverage_percent": 85,
     "what_is_missing": "Error handling paths and negative test cases"
-  }},
+  },
 
   "top_3_priorities": [
-    {{
+    {
       "issue": "Add config fallbacks using default_profiler_config",
       "why": "Test will fail in environments where ConfigUtils is incomplete",
       "impact_if_not_fixed": "Test becomes environment-dependent and brittle",
       "estimated_effort": "10 minutes",
       "how_to_fix": "Add helper function: get_config(key, fallback) that checks ConfigUtils then default_profiler_config"
-    }},
-    {{
+    },
+    {
       "issue": "Replace bare except clauses with specific exception handling",
       "why": "Bare except catches SystemExit and KeyboardInterrupt, masks real errors",
       "impact_if_not_fixed": "Debugging becomes difficult, may hide critical failures",
       "estimated_effort": "5 minutes",
       "how_to_fix": "Change 'except:' to 'except Exception as e:' and re-raise with context"
-    }},
-    {{
+    },
+    {
       "issue": "Use Robot Framework BuiltIn assertions instead of Python assert",
       "why": "Python asserts can be disabled with -O flag and provide poor Robot reports",
       "impact_if_not_fixed": "Tests may pass when they should fail in optimized mode",
       "estimated_effort": "5 minutes",
       "how_to_fix": "Import BuiltIn library and use should_be_equal() or should_be_true()"
-    }}
+    }
   ],
 
   "strengths": [
@@ -1819,7 +1837,7 @@ Provide a comprehensive review in the following JSON format:
   ],
 
   "potential_issues": [
-    {{
+    {
       "severity": "medium",
       "file": "python_file",
       "location": "test_admin_login_functionality method",
@@ -1827,8 +1845,8 @@ Provide a comprehensive review in the following JSON format:
       "suggestion": "Add helper to read from ConfigUtils with fallback to default_profiler_config",
       "estimated_effort": "10 minutes",
       "impact_if_not_fixed": "Test fails with KeyError in some environments"
-    }},
-    {{
+    },
+    {
       "severity": "medium",
       "file": "python_file",
       "location": "INITIALIZE and SuiteCleanup methods",
@@ -1836,8 +1854,8 @@ Provide a comprehensive review in the following JSON format:
       "suggestion": "Use 'except Exception as e:' and re-raise to preserve traceback",
       "estimated_effort": "5 minutes",
       "impact_if_not_fixed": "Debugging becomes difficult, may mask critical errors"
-    }},
-    {{
+    },
+    {
       "severity": "low",
       "file": "python_file",
       "location": "Module-level globals",
@@ -1845,7 +1863,7 @@ Provide a comprehensive review in the following JSON format:
       "suggestion": "Remove unused variables and consolidate to single browseractions instance",
       "estimated_effort": "3 minutes",
       "impact_if_not_fixed": "Code clutter, potential confusion for maintainers"
-    }}
+    }
   ],
 
   "recommendations": [
@@ -1856,7 +1874,7 @@ Provide a comprehensive review in the following JSON format:
     "Add edge case handling for missing or changed landing page text"
   ],
 
-  "correctness_analysis": {{
+  "correctness_analysis": {
     "meets_requirements": true,
     "requirement_coverage_percent": 85,
     "what_works": "Implements core login, landing page verification, and logout flow correctly",
@@ -1867,13 +1885,13 @@ Provide a comprehensive review in the following JSON format:
       "BrowserActions.verify_text_on_page and close_browser_window methods exist"
     ],
     "production_readiness": "Ready for happy-path testing, needs error handling for production"
-  }},
+  },
 
   "security_concerns": [
     "Credentials passed in plain dict - ensure not logged in plain text",
     "Landing page text verification could fail if text contains HTML/scripts"
   ]
-}}
+}
 
 IMPORTANT RULES:
 1. Limit recommendations to 5 maximum (consolidate related items)
@@ -1892,30 +1910,115 @@ RATING SCALE:
 
 Generate the review now as valid JSON:"""
 
+_REVIEW_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are an expert code reviewer. Provide thorough, constructive reviews in valid JSON format. Follow the schema exactly."
+}
+
+
+def _review_generated_code(files: dict, test_description: str, framework_type: str = 'pstaff') -> dict:
+    """
+    Review generated code for quality, potential issues, and provide ratings
+
+    Args:
+        files: Dictionary containing robot_file, python_file, data_file
+        test_description: Original test case description
+        framework_type: 'pstaff' or 'client'
+
+    Returns:
+        Dictionary with review results, ratings, issues, and recommendations
+    """
+    client = get_openai_client()
+
+    # Framework-specific review prompts
+    framework_specifics = ""
+    if framework_type == 'client':
+        framework_specifics = """
+FRAMEWORK-SPECIFIC VALIDATION (Client Framework - aut-pypdc):
+- Does this follow aut-pypdc pytest patterns and PPS module conventions?
+- Are PpsRestClient methods (loginSA, put, get, post, delete) used correctly?
+- Is FWUtils used properly for configuration management?
+- Do test functions follow TC_<ID>_PPS_<NAME>() naming pattern?
+- Does the test runner use pytest conventions (test_* functions)?
+- Are admin_pps modules (PpsRestUtils, authentication, etc.) imported correctly?
+- Is logging done correctly with log.info() for test steps?
+"""
+    else:
+        framework_specifics = """
+FRAMEWORK-SPECIFIC VALIDATION (PSTAFF - aut-pstaf):
+- Does this follow PSTAF naming conventions and patterns?
+- Are Robot Framework keyword names descriptive and follow library conventions?
+- Are PSTAF utility methods (ConfigUtils, AppAccess, BrowserActions) used correctly?
+- Are dependencies used as documented in framework examples?
+"""
+
+    review_prompt = f"""You are a senior code reviewer specializing in test automation quality assurance.
+
+Review the following generated test files for quality, correctness, and potential issues.
+
+Framework: {framework_type.upper()}
+
+ORIGINAL TEST REQUIREMENT:
+{test_description}
+
+GENERATED FILES:
+
+=== {files['feature_name']}.robot ===
+{files['robot_file']}
+
+=== {files['feature_name']}.py ===
+{files['python_file']}
+
+=== {files['feature_name']}_Data.py ===
+{files['data_file']}
+
+REVIEW CRITERIA:
+1. **Correctness**: Does the code correctly implement the test requirement? What percentage of requirements are covered?
+2. **Framework Compliance**: Does it follow Robot Framework and PSTAF framework best practices and naming conventions?
+3. **Code Quality**: Is the code clean, maintainable, well-structured, and free of code smells?
+4. **Error Handling**: Are errors properly handled with appropriate fallbacks and logging?
+5. **Data Management**: Is test data properly separated, validated, and managed?
+6. **Best Practices**: Does it follow testing best practices including proper assertions and cleanup?
+7. **Test Coverage**: What scenarios are NOT covered? What edge cases, negative paths, and error conditions are missing?
+8. **Security**: Are there any security vulnerabilities (credential exposure, injection risks, etc.)?
+
+SEVERITY LEVEL GUIDELINES - BE PRECISE:
+- **critical**: Security vulnerabilities (exposed credentials, SQL injection, XSS), data corruption, system crashes, infinite loops, authentication bypasses
+- **high**: Race conditions, memory leaks, incorrect core logic, missing critical error handling, data loss risks
+- **medium**: Hardcoded values that should be configurable, poor error messages, missing input validation, code that works but is fragile
+- **low**: Code style issues, unused variables, minor redundancy, missing comments
+- **info**: Suggestions for future enhancements, alternative approaches
+
+{framework_specifics}
+
+{_REVIEW_PROMPT_TAIL}"""
+
     try:
         response = client.chat.completions.create(
             model=config.AZURE_OPENAI_DEPLOYMENT,
             messages=[
-                {"role": "system", "content": "You are an expert code reviewer. Provide thorough, constructive reviews in valid JSON format. Follow the schema exactly."},
+                _REVIEW_SYSTEM_MESSAGE,
                 {"role": "user", "content": review_prompt}
             ],
-            max_completion_tokens=6000,  # Increased for comprehensive review with all new fields
-            temperature=0.2  # Lower temperature for consistent reviews
+            max_completion_tokens=config.REVIEW_MAX_TOKENS,
+            temperature=config.REVIEW_TEMPERATURE,
+            seed=config.REVIEW_SEED,  # Fixed seed keeps reviews as reproducible as the deployment allows
+            stream=True
         )
 
-        review_content = response.choices[0].message.content
+        review_content = _read_streamed_json(response)
 
-        # Parse JSON from response
+        # Parse JSON from response (fenced or bare): one find() decides the path
         try:
-            if '```json' in review_content:
-                review_content = review_content.split('```json')[1].split('```')[0].strip()
-            elif '```' in review_content:
-                review_content = review_content.split('```')[1].split('```')[0].strip()
-
-            review = json.loads(review_content)
+            fence = review_content.find('```')
+            if fence != -1:
+                start = review_content.find('{', fence)
+                end = review_content.rfind('}')
+                review_content = review_content[start:end + 1]
+            review = _json_loads(review_content)
             return review
 
-        except json.JSONDecodeError as e:
+        except ValueError as e:  # json/orjson decode errors both subclass ValueError
             logger.error(f"Failed to parse review JSON: {e}")
             # Return default review structure
             return {
@@ -1947,11 +2050,11 @@ Generate the review now as valid JSON:"""
 
 @app.errorhandler(404)
 def not_found(e):
-    return render_template('404.html'), 404
+    return _ERROR_PAGES.get(404) or render_template('404.html'), 404
 
 @app.errorhandler(500)
 def server_error(e):
-    return render_template('500.html'), 500
+    return _ERROR_PAGES.get(500) or render_template('500.html'), 500
 
 # ============================================================================
 # MAIN
@@ -1965,6 +2068,9 @@ if __name__ == '__main__':
     # Initialize components BEFORE starting Flask
     init_components()
 
+    # Compile the routing map now instead of on the first request
+    app.url_map.update()
+
     # Run Flask app
-    logger.info("Flask app starting on http://127.0.0.1:5000")
-    app.run(debug=True, host='0.0.0.0', port=5000, use_reloader=False)
+    logger.info(f"Flask app starting on http://127.0.0.1:5000 (env={config.FLASK_ENV}, debug={config.FLASK_DEBUG})")
+    app.run(debug=config.FLASK_DEBUG, host='0.0.0.0', port=5000, use_reloader=False)
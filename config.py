@@ -14,16 +14,35 @@ from dotenv import load_dotenv
 load_dotenv()
 
 # Base Paths
-BASE_DIR = Path(__file__).parent
+BASE_DIR = Path(__file__).resolve().parent
 DATA_DIR = BASE_DIR / "data"
 DOCS_DIR = DATA_DIR / "docs"
 INDEX_DIR = DATA_DIR / "faiss_index"
 LOGS_DIR = DATA_DIR / "logs"
 EMBEDDINGS_DIR = DATA_DIR / "embeddings"
+QUERY_EMBEDDING_CACHE_DIR = EMBEDDINGS_DIR / "queries"  # Memory-mapped query vectors
+QUERY_EMBEDDING_CACHE_MAX_FILES = 1000  # Per model; least recently used vectors are evicted
 
-# Ensure directories exist
-for directory in [DATA_DIR, DOCS_DIR, INDEX_DIR, LOGS_DIR, EMBEDDINGS_DIR]:
-    directory.mkdir(parents=True, exist_ok=True)
+_storage_initialized = False
+
+
+def _ensure_dirs():
+    """Create the data directories used by the RAG system"""
+    for directory in [DATA_DIR, DOCS_DIR, INDEX_DIR, LOGS_DIR, EMBEDDINGS_DIR]:
+        directory.mkdir(parents=True, exist_ok=True)
+
+
+def init_storage():
+    """
+    Ensure data directories exist (idempotent)
+
+    Called by components that write to disk (logger, vector store) rather
+    than at import, so tools that only read configuration don't touch disk.
+    """
+    global _storage_initialized
+    if not _storage_initialized:
+        _ensure_dirs()
+        _storage_initialized = True
 
 # FAISS Index Configuration
 FAISS_INDEX_PATH = INDEX_DIR / "faiss_index.bin"
@@ -41,7 +60,8 @@ CHUNK_OVERLAP = 200  # Overlap between chunks to maintain context
 MIN_CHUNK_SIZE = 100  # Minimum viable chunk size
 
 # Supported file types
-SUPPORTED_FORMATS = [".txt", ".pdf", ".docx", ".md", ".json"]
+SUPPORTED_FORMATS = (".txt", ".pdf", ".docx", ".md", ".json")  # Ordered, for display
+SUPPORTED_FORMATS_SET = frozenset(SUPPORTED_FORMATS)  # For membership checks
 
 # Search Configuration
 DEFAULT_TOP_K = 5  # Number of results to return
@@ -52,6 +72,10 @@ LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 LOG_FILE = LOGS_DIR / "rag_system.log"
 
+# Web App Configuration
+FLASK_ENV = os.getenv("FLASK_ENV", "development")
+FLASK_DEBUG = FLASK_ENV == "development"  # Debugger middleware only in development
+
 # Performance Configuration
 USE_GPU = False  # Set to True if GPU available
 MAX_WORKERS = 4  # For parallel processing
@@ -100,8 +124,8 @@ MAX_ITERATIONS = 3  # Maximum agent iterations for refinement
 
 # Test Case Generation Configuration
 MIN_TEST_CASES_PER_FEATURE = 10  # Minimum test cases to generate
-COVERAGE_TYPES = ["positive", "negative", "boundary", "integration", "security", "performance"]
-OUTPUT_FORMATS = ["json", "markdown", "excel"]  # Supported output formats
+COVERAGE_TYPES = ("positive", "negative", "boundary", "integration", "security", "performance")
+OUTPUT_FORMATS = ("json", "markdown", "excel")  # Supported output formats
 
 # ============================================================================
 # MULTIMODAL IMAGE PROCESSING CONFIGURATION
@@ -134,6 +158,12 @@ CODEX_API_VERSION = os.getenv("CODEX_API_VERSION", "2024-12-01-preview")
 SCRIPT_MAX_TOKENS = 4000  # Maximum tokens for generated scripts
 SCRIPT_TEMPERATURE = 0.7  # Temperature for code generation (lower = more deterministic)
 
+# Framework-aware generation / review (/api/framework/generate-script)
+FRAMEWORK_SCRIPT_MAX_TOKENS = 8000  # Three framework files + feedback (includes GPT-5 reasoning tokens)
+REVIEW_MAX_TOKENS = 6000  # Full review schema (scores, issues, coverage gaps) needs ~6000
+REVIEW_TEMPERATURE = LLM_TEMPERATURE  # GPT-5.1 deployments only accept 1.0
+REVIEW_SEED = 42  # Fixed seed so identical inputs produce near-identical reviews
+
 # Image Processing Parameters
 IMAGE_MIN_SIZE = 100  # Minimum image size (pixels) to process (filters out icons/logos)
 MAX_IMAGES_PER_PAGE = 10  # Maximum images to process per PDF page
@@ -12,13 +12,17 @@ the async API. Provides:
 - Automatic screenshot capture on failure
 """
 
-import asyncio
+import hashlib
+import json
 import logging
+import logging.handlers
 import os
+import queue
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, AsyncGenerator, Dict, Generator, Optional
+from typing import Any, AsyncGenerator, Dict, Optional
 
 import pytest
 from playwright.async_api import (
@@ -48,6 +52,19 @@ HEADLESS = True
 VIEWPORT = {"width": 1920, "height": 1080}
 DEFAULT_TIMEOUT_MS = 30_000  # 30 seconds
 
+# Saved login state (cookies + localStorage). Reused across pytest runs while
+# younger than AUTH_STATE_TTL_S so repeated runs skip the UI login entirely.
+# Kept in this job's directory, one owner-only file per base URL and user.
+AUTH_STATE_DIR = Path(__file__).resolve().parent / ".auth"
+AUTH_STATE_TTL_S = int(os.getenv("PW_AUTH_STATE_TTL_S", "1800"))
+
+# Screenshot directory, created in pytest_sessionstart and kept on config.stash
+SCREENSHOT_DIR_KEY = pytest.StashKey[Path]()
+
+# Present on the login page only; seeing it after restoring the saved state
+# means the session expired or was revoked.
+LOGIN_FORM_SELECTOR = 'input[name="password"]'
+
 
 # =============================================================================
 # Logging setup
@@ -59,30 +76,63 @@ def _create_log_directory() -> Path:
     return logs_dir
 
 
-def _configure_root_logger() -> None:
-    """Configure root logger for test run."""
+class _CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that reuses the formatted timestamp within the same second.
+
+    The default ``formatTime`` calls ``localtime`` + ``strftime`` for every
+    record; here that happens at most once per second and only the
+    millisecond suffix is formatted per record.
+    """
+
+    def __init__(self, fmt: str) -> None:
+        super().__init__(fmt)
+        self._last_second = -1
+        self._last_str = ""
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        second = int(record.created)
+        if second != self._last_second:
+            self._last_second = second
+            self._last_str = time.strftime("%Y-%m-%d %H:%M:%S", self.converter(second))
+        return "%s,%03d" % (self._last_str, record.msecs)
+
+
+def _configure_root_logger() -> logging.handlers.QueueListener:
+    """
+    Configure root logger for test run.
+
+    Records are put on an in-memory queue by a QueueHandler; a background
+    QueueListener thread does the actual console/file I/O so logging never
+    blocks test execution. Returns the started listener.
+    """
     logs_dir = _create_log_directory()
     timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
     log_file = logs_dir / f"test_run_{timestamp}.log"
 
-    # Basic configuration
-    log_level = os.getenv("LOG_LEVEL", "INFO").upper()
-    logging.basicConfig(
-        level=log_level,
-        format="%(asctime)s [%(levelname)s] [%(name)s] %(message)s",
-        handlers=[
-            logging.StreamHandler(sys.stdout),
-            logging.FileHandler(log_file, encoding="utf-8"),
-        ],
-    )
+    formatter = _CachedTimeFormatter("%(asctime)s [%(levelname)s] [%(name)s] %(message)s")
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(formatter)
+    file_handler = logging.FileHandler(log_file, encoding="utf-8")
+    file_handler.setFormatter(formatter)
+
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    root = logging.getLogger()
+    root.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
 
     logging.getLogger("asyncio").setLevel(logging.WARNING)
     logging.getLogger("playwright").setLevel(logging.INFO)
 
+    listener = logging.handlers.QueueListener(
+        log_queue, stream_handler, file_handler, respect_handler_level=True
+    )
+    listener.start()
+    return listener
+
 
-# Configure logging as soon as the module is imported
-_configure_root_logger()
 logger = logging.getLogger(__name__)
+_log_listener: Optional[logging.handlers.QueueListener] = None
 
 
 # =============================================================================
@@ -119,13 +169,38 @@ def pytest_addoption(parser: pytest.Parser) -> None:
     )
 
 
-def pytest_configure(config: pytest.Config) -> None:
-    """Pytest configuration hook."""
-    logger.info("Pytest configuration initialized")
-    logger.info("Environment: %s", config.getoption("--env"))
-    logger.info("Base URL: %s", config.getoption("--base-url"))
-    logger.info("Browser: %s", config.getoption("--browser"))
-    logger.info("Headless: %s", not config.getoption("--headed"))
+def pytest_sessionstart(session: pytest.Session) -> None:
+    """Set up logging once the test session starts."""
+    global _log_listener
+    _log_listener = _configure_root_logger()
+
+    config = session.config
+    # Create the screenshot directory once; the failure hook reads it from the stash
+    screenshot_dir = Path("screenshots")
+    screenshot_dir.mkdir(parents=True, exist_ok=True)
+    config.stash[SCREENSHOT_DIR_KEY] = screenshot_dir
+
+    if config.getoption("verbose", 0) < 0:
+        return
+    logger.info(
+        "Pytest configuration initialized: env=%s base_url=%s browser=%s headless=%s",
+        config.getoption("--env"),
+        config.getoption("--base-url"),
+        config.getoption("--browser"),
+        not config.getoption("--headed"),
+    )
+
+
+def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
+    """Flush queued log records and stop the logging thread."""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
+
+# Attribute names for each report phase, so the hook doesn't format one per call
+_REP_NAMES = {"setup": "rep_setup", "call": "rep_call", "teardown": "rep_teardown"}
 
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
@@ -138,7 +213,7 @@ def pytest_runtest_makereport(item: pytest.Item, call: pytest.CallInfo) -> Any:
     """
     outcome = yield
     rep = outcome.get_result()
-    setattr(item, f"rep_{rep.when}", rep)
+    setattr(item, _REP_NAMES[rep.when], rep)
 
 
 # =============================================================================
@@ -241,17 +316,89 @@ async def browser(
                 logger.warning("Error while closing browser: %s", exc)
 
 
+def _auth_state_file(base_url: str, username: str) -> Path:
+    """State file for one base URL + user, so targets never share a session."""
+    key = hashlib.sha256(f"{base_url}\0{username}".encode("utf-8")).hexdigest()[:16]
+    return AUTH_STATE_DIR / f"auth_{key}.json"
+
+
+def _auth_state_is_fresh(path: Path) -> bool:
+    try:
+        return time.time() - path.stat().st_mtime < AUTH_STATE_TTL_S
+    except FileNotFoundError:
+        return False
+
+
+async def _save_auth_state(context: BrowserContext, path: Path) -> None:
+    """Write the context's storage state to `path` atomically, readable only by the owner."""
+    state = await context.storage_state()
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w", encoding="utf-8") as fh:
+        json.dump(state, fh)
+    os.replace(tmp_path, path)
+
+
+@pytest.fixture(scope="session")
+async def auth_state(
+    browser: Browser,
+    base_url: str,
+    test_password: str,
+) -> str:
+    """
+    Path to a saved, authenticated storage state.
+
+    Performs the UI login at most once per AUTH_STATE_TTL_S: a state file
+    saved by a recent run (even a previous pytest invocation) against the
+    same base URL and user is reused.
+    """
+    state_file = _auth_state_file(base_url, USERNAME)
+    if _auth_state_is_fresh(state_file):
+        logger.info("Reusing saved authentication state: %s", state_file)
+        return str(state_file)
+
+    logger.info("Logging in to create authentication state")
+    context: Optional[BrowserContext] = None
+    try:
+        context = await browser.new_context(
+            base_url=base_url,
+            viewport=VIEWPORT,
+        )
+        context.set_default_timeout(DEFAULT_TIMEOUT_MS)
+
+        page = await context.new_page()
+        page.set_default_timeout(DEFAULT_TIMEOUT_MS)
+
+        await _perform_login(page, base_url, USERNAME, test_password)
+        await _save_auth_state(context, state_file)
+        logger.info("Saved authentication state: %s", state_file)
+        return str(state_file)
+    except Exception as exc:
+        logger.exception("Error creating authentication state: %s", exc)
+        raise
+    finally:
+        if context:
+            try:
+                await context.close()
+            except Exception as exc:
+                logger.warning("Error while closing login context: %s", exc)
+
+
 @pytest.fixture(scope="session")
 async def auth_context(
     browser: Browser,
     base_url: str,
+    auth_state: str,
     test_password: str,
 ) -> AsyncGenerator[BrowserContext, None]:
     """
     Authenticated browser context.
 
-    - Logs in once per session.
-    - Reuses the same context (and storage state) across tests.
+    - Starts from the saved login state (see ``auth_state``).
+    - Logs in again (and refreshes the saved state) if the restored session
+      lands on the login page.
+    - Reuses the same context across tests.
     """
     logger.info("Creating authenticated browser context")
     context: Optional[BrowserContext] = None
@@ -259,13 +406,19 @@ async def auth_context(
         context = await browser.new_context(
             base_url=base_url,
             viewport=VIEWPORT,
+            storage_state=auth_state,
         )
         context.set_default_timeout(DEFAULT_TIMEOUT_MS)
 
         page = await context.new_page()
-        page.set_default_timeout(DEFAULT_TIMEOUT_MS)
-
-        await _perform_login(page, base_url, USERNAME, test_password)
+        try:
+            await page.goto(base_url, wait_until="load")
+            if await page.locator(LOGIN_FORM_SELECTOR).is_visible():
+                logger.info("Saved authentication state is no longer valid; logging in again")
+                await _perform_login(page, base_url, USERNAME, test_password)
+                await _save_auth_state(context, Path(auth_state))
+        finally:
+            await page.close()
 
         yield context
     except Exception as exc:
@@ -375,8 +528,14 @@ async def auth_page(
 # Test data management fixture
 # =============================================================================
 
+@pytest.fixture(scope="session")
+def _test_data_base(pytestconfig: pytest.Config) -> Dict[str, Any]:
+    """Invariant part of `test_data`, read from the CLI options once per session."""
+    return {"env": pytestconfig.getoption("--env")}
+
+
 @pytest.fixture(scope="function")
-def test_data(request: pytest.FixtureRequest) -> Dict[str, Any]:
+def test_data(request: pytest.FixtureRequest, _test_data_base: Dict[str, Any]) -> Dict[str, Any]:
     """
     Test data fixture.
 
@@ -390,8 +549,8 @@ def test_data(request: pytest.FixtureRequest) -> Dict[str, Any]:
     nodeid = request.node.nodeid
     logger.debug("Initializing test data for: %s", nodeid)
     return {
+        **_test_data_base,
         "test_name": nodeid,
-        "env": request.config.getoption("--env"),
         "timestamp": datetime.utcnow().isoformat(),
     }
 
@@ -400,12 +559,6 @@ def test_data(request: pytest.FixtureRequest) -> Dict[str, Any]:
 # Screenshot on failure
 # =============================================================================
 
-def _create_screenshot_directory() -> Path:
-    screenshots_dir = Path("screenshots")
-    screenshots_dir.mkdir(parents=True, exist_ok=True)
-    return screenshots_dir
-
-
 @pytest.fixture(scope="function", autouse=True)
 async def screenshot_on_failure(
     request: pytest.FixtureRequest,
@@ -439,7 +592,7 @@ async def screenshot_on_failure(
         logger.debug("No page fixture found for test %s; skipping screenshot", item.name)
         return
 
-    screenshots_dir = _create_screenshot_directory()
+    screenshots_dir = request.config.stash[SCREENSHOT_DIR_KEY]
     timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
     safe_name = item.nodeid.replace("/", "_").replace("::", "__").replace(" ", "_")
     screenshot_path = screenshots_dir / f"{safe_name}_{timestamp}.png"
@@ -451,21 +604,3 @@ async def screenshot_on_failure(
         logger.warning("Playwright error while taking screenshot: %s", exc)
     except Exception as exc:
         logger.warning("Unexpected error while taking screenshot: %s", exc)
-
-
-# =============================================================================
-# Event loop fixture for async tests (if needed)
-# =============================================================================
-
-@pytest.fixture(scope="session")
-def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
-    """
-    Custom event loop for pytest-asyncio.
-
-    This ensures a single event loop is used for the entire test session,
-    which works better with Playwright's async API.
-    """
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    yield loop
-    loop.close()
\ No newline at end of file
@@ -0,0 +1,342 @@
+"""
+basic_config_helpers.py
+
+Shared locators and helpers for the Profiler > Profiler Configuration >
+Settings > Basic Configuration page used by TC_001 (save and reset
+scenarios) and TC_003.
+"""
+
+import asyncio
+import logging
+import os
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+import pytest
+from playwright.async_api import Error, Locator, Page, TimeoutError, expect
+
+
+logger = logging.getLogger(__name__)
+
+# Direct URL of the Basic Configuration page (relative to the context base_url).
+# When unset, or if the direct load fails, the helpers navigate through the menus.
+BASIC_CONFIG_URL = os.getenv("BASIC_CONFIG_URL", "")
+
+# REST endpoint backing the Basic Configuration form (relative to the context
+# base_url). When unset, or if the request fails or returns unexpected data,
+# the committed values are re-read through the UI instead.
+BASIC_CONFIG_API_URL = os.getenv("BASIC_CONFIG_API_URL", "")
+
+# True once the form's inputs exist and the saved values have been rendered
+FORM_READY_JS = """() => {
+    const polling = document.querySelector("input[name='pollingInterval']");
+    const dhcpv6 = document.querySelector("input[name='enableDhcpv6Capture']");
+    return !!(polling && dhcpv6 && polling.value.length > 0);
+}"""
+
+
+@dataclass
+class BasicConfigLocators:
+    """
+    Locators for the Basic Configuration page, built once per test.
+
+    Locators resolve lazily on each use, so a single bundle (including
+    `header`) stays valid across reloads and re-navigation; helpers should
+    take the bundle rather than rebuilding locators.
+
+    All locators use CSS/attribute selectors, which avoid the
+    accessibility-tree walk `get_by_role`/`get_by_label` perform on every
+    evaluation. Exact-text matches (`:text-is`) keep "Profiler" from also
+    matching "Profiler Configuration". Adjust the selectors to match the real
+    application DOM.
+    """
+
+    page: Page
+
+    # Navigation menu
+    profiler_menu: Locator = field(init=False)
+    profiler_config_menu: Locator = field(init=False)
+    settings_menu: Locator = field(init=False)
+    basic_config_link: Locator = field(init=False)
+
+    # Basic configuration form
+    header: Locator = field(init=False)
+    dhcpv6_capture: Locator = field(init=False)
+    dhcpv6_sniff: Locator = field(init=False)
+    polling: Locator = field(init=False)
+    save: Locator = field(init=False)
+    reset: Locator = field(init=False)
+    delete_profiler: Locator = field(init=False)
+
+    # Reset confirmation dialog (if present)
+    reset_confirm: Locator = field(init=False)
+    reset_cancel: Locator = field(init=False)
+
+    # Save feedback
+    success_message: Locator = field(init=False)
+    generic_success: Locator = field(init=False)
+
+    def __post_init__(self) -> None:
+        page = self.page
+
+        self.profiler_menu = page.locator("a:text-is('Profiler')")
+        self.profiler_config_menu = page.locator("a:text-is('Profiler Configuration')")
+        self.settings_menu = page.locator("a:text-is('Settings')")
+        self.basic_config_link = page.locator("a:text-is('Basic Configuration')")
+
+        self.header = page.locator(":is(h1, h2, h3):text-is('Basic Configuration')")
+        self.dhcpv6_capture = page.locator("input[name='enableDhcpv6Capture']")
+        self.dhcpv6_sniff = page.locator("input[name='enableDhcpv6Sniffing']")
+        self.polling = page.locator("input[name='pollingInterval']")
+        self.save = page.locator("button:text-is('Save Changes'), input[value='Save Changes']")
+        self.reset = page.locator("button:text-is('Reset'), input[value='Reset']")
+        self.delete_profiler = page.locator(
+            "button:text-is('Delete Profiler'), input[value='Delete Profiler']"
+        )
+
+        self.reset_confirm = page.locator("button:text-is('OK'), input[value='OK']")
+        self.reset_cancel = page.locator("button:text-is('Cancel'), input[value='Cancel']")
+
+        self.success_message = page.locator("text=Changes saved successfully")
+        self.generic_success = page.locator(
+            "css=.msg-success, .alert-success, .ui-message-success"
+        )
+
+
+async def safe_click(
+    locator: Locator, description: str, timeout: int = 2_000, retries: int = 1
+) -> None:
+    """
+    Click with basic error handling and logging.
+
+    Starts with a short visibility wait and retries with a 4x longer one
+    (2s, then 8s by default) instead of a blanket 10s per click.
+    """
+    for attempt in range(retries + 1):
+        try:
+            await expect(locator).to_be_visible(timeout=timeout)
+            await locator.click()
+            return
+        except (AssertionError, TimeoutError) as exc:
+            if attempt < retries:
+                timeout *= 4
+                continue
+            logger.error("Timed out waiting to click %s: %s", description, exc)
+            pytest.fail(f"Timed out waiting to click {description}")
+        except Error as exc:
+            logger.error("Failed to click %s: %s", description, exc)
+            pytest.fail(f"Failed to click {description}: {exc}")
+
+
+async def wait_for_form_ready(locators: BasicConfigLocators, timeout: int = 10_000) -> None:
+    """
+    Wait until the Basic Configuration form is populated.
+
+    A single in-page wait_for_function on FORM_READY_JS replaces separate
+    header/field visibility polls. Raises Playwright's TimeoutError.
+    """
+    await locators.page.wait_for_function(FORM_READY_JS, timeout=timeout)
+
+
+async def navigate_to_basic_configuration(
+    locators: BasicConfigLocators, suffix: str = ""
+) -> None:
+    """
+    Open Basic Configuration and wait for the form to be ready.
+
+    Loads BASIC_CONFIG_URL directly when configured (one navigation instead
+    of four menu clicks) and falls back to the menu chain otherwise.
+    """
+    if BASIC_CONFIG_URL:
+        try:
+            await locators.page.goto(BASIC_CONFIG_URL, wait_until="domcontentloaded")
+            await wait_for_form_ready(locators)
+            return
+        except Error as exc:
+            logger.warning(
+                "Direct navigation to %s failed (%s); using menu navigation.",
+                BASIC_CONFIG_URL,
+                exc,
+            )
+
+    await safe_click(locators.profiler_menu, f"Profiler menu{suffix}")
+    await safe_click(locators.profiler_config_menu, f"Profiler Configuration menu{suffix}")
+    await safe_click(locators.settings_menu, f"Settings menu{suffix}")
+    await safe_click(locators.basic_config_link, f"Basic Configuration link{suffix}")
+
+    try:
+        await wait_for_form_ready(locators)
+    except TimeoutError as exc:
+        logger.error("Basic Configuration page did not load%s: %s", suffix, exc)
+        pytest.fail(f"Basic Configuration page did not load{suffix}")
+
+
+async def ensure_checked(locator: Locator, description: str) -> None:
+    """Check a checkbox if it is not already checked."""
+    try:
+        await expect(locator).to_be_visible(timeout=10_000)
+        if not await locator.is_checked():
+            await locator.check()
+    except Error as exc:
+        logger.error("Failed to enable %s: %s", description, exc)
+        pytest.fail(f"Failed to enable {description}: {exc}")
+
+
+async def assert_checkbox_checked(locator: Locator, description: str) -> None:
+    """Assert that a checkbox is checked with explicit error message."""
+    try:
+        await expect(locator).to_be_visible(timeout=10_000)
+        await expect(locator).to_be_checked()
+    except AssertionError as exc:
+        logger.error("%s is not checked as expected: %s", description, exc)
+        pytest.fail(f"{description} is not checked as expected")
+    except TimeoutError as exc:
+        logger.error("Timed out waiting for %s to be visible: %s", description, exc)
+        pytest.fail(f"Timed out waiting for {description} to be visible")
+
+
+async def get_input_value(locator: Locator, description: str) -> Optional[str]:
+    """Get the value of an input with error handling."""
+    try:
+        await expect(locator).to_be_visible(timeout=10_000)
+        value = await locator.input_value()
+        logger.info("%s current value: %s", description, value)
+        return value
+    except TimeoutError as exc:
+        logger.error("Timed out waiting for %s input: %s", description, exc)
+        pytest.fail(f"Timed out waiting for {description} input")
+    except Error as exc:
+        logger.error("Failed to read %s input value: %s", description, exc)
+        pytest.fail(f"Failed to read {description} input value")
+    return None
+
+
+async def get_basic_config_snapshot(locators: BasicConfigLocators) -> Dict[str, Any]:
+    """Capture current basic configuration values from the UI."""
+    try:
+        # Independent reads of the same form; issue them concurrently
+        polling_value, dhcpv6_checked = await asyncio.gather(
+            locators.polling.input_value(),
+            locators.dhcpv6_capture.is_checked(),
+        )
+    except Error as exc:
+        logger.error("Error reading basic configuration values: %s", exc)
+        raise AssertionError(
+            "Unable to read basic configuration values from the form."
+        ) from exc
+
+    return {
+        "polling_interval": polling_value,
+        "dhcpv6_enabled": dhcpv6_checked,
+    }
+
+
+async def trigger_reset_and_confirm(
+    locators: BasicConfigLocators, baseline_polling: str
+) -> None:
+    """
+    Click Reset and confirm any confirmation dialog.
+
+    Handles both cases:
+    - Confirmation dialog appears.
+    - No confirmation dialog; the form reverts to `baseline_polling`.
+
+    The dialog wait is raced against the revert so the first observable
+    outcome wins instead of always paying a fixed wait for the dialog. When
+    the dialog is confirmed, waits for the revert afterwards, so callers can
+    read the form as soon as this returns.
+    """
+    try:
+        await locators.reset.click()
+    except Error as exc:
+        logger.error("Error clicking Reset button: %s", exc)
+        raise AssertionError("Unable to click Reset button.") from exc
+
+    dialog_task = asyncio.create_task(locators.reset_confirm.wait_for(timeout=5000))
+    reverted_task = asyncio.create_task(
+        expect(locators.polling).to_have_value(baseline_polling, timeout=5000)
+    )
+    pending = {dialog_task, reverted_task}
+    dialog_shown = False
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            if dialog_task in done and dialog_task.exception() is None:
+                dialog_shown = True
+                break
+            if reverted_task in done and reverted_task.exception() is None:
+                break
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    if not dialog_shown:
+        logger.info("No reset confirmation dialog detected; proceeding.")
+        return
+
+    try:
+        await locators.reset_confirm.click()
+    except Error as exc:
+        logger.error("Error handling reset confirmation dialog: %s", exc)
+        # Try to cancel to avoid leaving UI in unknown state
+        try:
+            await locators.reset_cancel.click()
+        except Error:
+            pass
+        raise AssertionError(
+            "Error while handling reset confirmation dialog."
+        ) from exc
+
+    try:
+        await expect(locators.polling).to_have_value(baseline_polling, timeout=5000)
+    except AssertionError:
+        # Fall through; the caller's assertions report the actual values.
+        logger.warning("Polling interval did not revert within 5 seconds.")
+
+
+def _parse_api_config(data: Any) -> Optional[Dict[str, Any]]:
+    """
+    Convert the API payload to a snapshot dict, or None if a field has an
+    unexpected type (bool("false") would otherwise report a false match).
+    """
+    if not isinstance(data, dict):
+        return None
+    polling = data.get("pollingInterval")
+    dhcpv6 = data.get("enableDhcpv6Capture")
+    if isinstance(polling, bool) or not isinstance(polling, (int, str)):
+        return None
+    if not isinstance(dhcpv6, bool):
+        return None
+    return {"polling_interval": str(polling), "dhcpv6_enabled": dhcpv6}
+
+
+async def read_committed_config(locators: BasicConfigLocators) -> Dict[str, Any]:
+    """
+    Read the configuration stored on the backend.
+
+    Uses a single request to BASIC_CONFIG_API_URL when it is configured and
+    falls back to re-opening the page and reading the form if the API is
+    unset, unavailable or returns unexpected data.
+    """
+    if BASIC_CONFIG_API_URL:
+        try:
+            resp = await locators.page.request.get(BASIC_CONFIG_API_URL)
+            if resp.ok:
+                config = _parse_api_config(await resp.json())
+                if config is not None:
+                    return config
+                logger.info("Basic configuration API returned unexpected data; re-reading via UI.")
+            else:
+                logger.info(
+                    "Basic configuration API returned %s; re-reading via UI.",
+                    resp.status,
+                )
+        except (Error, ValueError) as exc:
+            logger.info("Basic configuration API unavailable (%s); re-reading via UI.", exc)
+
+    # Re-open the page to force reload of data from backend
+    await navigate_to_basic_configuration(locators, " (re-read)")
+    return await get_basic_config_snapshot(locators)
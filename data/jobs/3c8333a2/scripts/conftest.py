@@ -8,22 +8,47 @@ Features:
 - Headless by default, configurable via CLI
 - Authenticated page fixture (session reuse)
 - Test data management fixture
-- Automatic screenshot on failure
+- Automatic screenshot on failure (page fixtures' teardown)
 - Centralized logging
 """
 
 import asyncio
+import copy
+import functools
 import json
 import logging
 import os
 import sys
+import time
 from contextlib import asynccontextmanager
-from datetime import datetime
 from pathlib import Path
-from typing import AsyncGenerator, Dict, Any, Optional
+from typing import Any, AsyncGenerator, AsyncIterator, Awaitable, Callable, Dict, Optional, TypeVar
 
 import pytest
-from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Playwright, Error as PWError
+from playwright.async_api import (
+    async_playwright,
+    Browser,
+    BrowserContext,
+    Page,
+    Playwright,
+    Route,
+    Error as PWError,
+    TimeoutError as PWTimeoutError,
+)
+
+from basic_config_helpers import (
+    BASIC_CONFIG_URL,
+    BasicConfigLocators,
+    navigate_to_basic_configuration,
+    wait_for_form_ready,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Screenshot directory, created in pytest_configure and kept on config.stash
+SCREENSHOT_DIR_KEY = pytest.StashKey[Path]()
 
 
 # =============================================================================
@@ -41,6 +66,33 @@ DEFAULT_TIMEOUT = 30_000  # ms for Playwright
 DEFAULT_USERNAME = "shravan"
 DEFAULT_PASSWORD_ENV_VAR = "TARGET_PASSWORD"  # must be set in environment
 
+# Element that only renders once login has completed (placeholder; adjust to real app)
+POST_LOGIN_SELECTOR = os.getenv("PW_POST_LOGIN_SELECTOR", "a:has-text('Sign Out')")
+
+# Failure screenshots: viewport-only JPEG unless full-page capture is requested
+SCREENSHOT_FULL_PAGE = os.getenv("PW_SCREENSHOT_FULL_PAGE", "0") == "1"
+SCREENSHOT_JPEG_QUALITY = 60
+
+# Chromium switches that skip background services and startup work unused in tests
+CHROMIUM_FAST_ARGS = [
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-background-timer-throttling",
+    "--disable-renderer-backgrounding",
+    "--disable-features=TranslateUI",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--mute-audio",
+]
+
+# Resource types dropped when --block-resources is set (stylesheets are kept,
+# since CSS affects element visibility checks)
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+
+# Number of authenticated contexts created ahead of the tests that need them
+AUTH_CONTEXT_PREFETCH = int(os.getenv("PW_AUTH_CONTEXT_PREFETCH", "2"))
+
 
 # =============================================================================
 # PYTEST HOOKS - CLI OPTIONS & LOGGING
@@ -87,36 +139,84 @@ def pytest_addoption(parser: pytest.Parser) -> None:
         default=DEFAULT_TIMEOUT,
         help="Default Playwright timeout in milliseconds.",
     )
+    group.addoption(
+        "--block-resources",
+        action="store_true",
+        default=False,
+        help="Abort image/font/media requests to speed up page loads.",
+    )
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that formats the timestamp at most once per second."""
+
+    def __init__(self, fmt: str, datefmt: str) -> None:
+        super().__init__(fmt=fmt, datefmt=datefmt)
+        self._last_second = -1
+        self._last_str = ""
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        second = int(record.created)
+        if second != self._last_second:
+            self._last_second = second
+            self._last_str = time.strftime(datefmt or self.datefmt, self.converter(second))
+        return self._last_str
 
 
 def _init_root_logger(log_level: int = logging.INFO) -> None:
     """Initialize root logger with console handler."""
-    logger = logging.getLogger()
-    if logger.handlers:
+    root_logger = logging.getLogger()
+    if root_logger.handlers:
         # Already configured (e.g., by another conftest)
         return
 
-    logger.setLevel(log_level)
+    # Our format never shows thread/process fields; skip collecting them per record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
+    root_logger.setLevel(log_level)
 
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(log_level)
 
-    formatter = logging.Formatter(
+    formatter = _CachedTimeFormatter(
         fmt="%(asctime)s [%(levelname)s] [%(name)s] %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
     )
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    root_logger.addHandler(console_handler)
 
 
 def pytest_configure(config: pytest.Config) -> None:
     """Global pytest configuration hook."""
     _init_root_logger()
-    logging.getLogger(__name__).info("Pytest configuration initialized.")
+    logger.info("Pytest configuration initialized.")
+
+    config.addinivalue_line(
+        "markers",
+        "destructive: test removes shared state; runs after all other tests, "
+        "and is deselected under xdist (run `pytest -m destructive` serially)",
+    )
+    config.addinivalue_line(
+        "markers",
+        "xdist_group(name): tests sharing server-side state; run on one xdist worker",
+    )
+
+    # Plain `-n N` distributes tests without regard to xdist_group; switch
+    # to loadgroup so grouped tests stay on a single worker.
+    if getattr(config.option, "dist", "no") == "load":
+        config.option.dist = "loadgroup"
 
-    # Ensure screenshot directory exists
-    screenshot_dir = Path(config.getoption("--screenshot-dir"))
+    # Ensure screenshot directory exists (created once; the fixture reuses it)
+    screenshot_dir = Path(config.getoption("--screenshot-dir")).resolve()
     screenshot_dir.mkdir(parents=True, exist_ok=True)
+    config.stash[SCREENSHOT_DIR_KEY] = screenshot_dir
+
+    # A login lock left by an interrupted run would make workers wait for a
+    # state file nobody is writing; clear it before any worker starts.
+    if not hasattr(config, "workerinput"):
+        SESSION_LOGIN_LOCK.unlink(missing_ok=True)
 
 
 # =============================================================================
@@ -127,7 +227,7 @@ def pytest_configure(config: pytest.Config) -> None:
 def base_url(pytestconfig: pytest.Config) -> str:
     """Base URL for the target system."""
     url = pytestconfig.getoption("--base-url")
-    logging.getLogger(__name__).info("Using base URL: %s", url)
+    logger.info("Using base URL: %s", url)
     return url
 
 
@@ -135,7 +235,7 @@ def base_url(pytestconfig: pytest.Config) -> str:
 def env(pytestconfig: pytest.Config) -> str:
     """Environment name (dev, qa, prod, etc.)."""
     environment = pytestconfig.getoption("--env")
-    logging.getLogger(__name__).info("Test environment: %s", environment)
+    logger.info("Test environment: %s", environment)
     return environment
 
 
@@ -143,7 +243,7 @@ def env(pytestconfig: pytest.Config) -> str:
 def browser_name(pytestconfig: pytest.Config) -> str:
     """Browser name to use with Playwright."""
     browser = pytestconfig.getoption("--browser")
-    logging.getLogger(__name__).info("Browser selected: %s", browser)
+    logger.info("Browser selected: %s", browser)
     return browser
 
 
@@ -157,22 +257,55 @@ def headed(pytestconfig: pytest.Config) -> bool:
 def pw_timeout(pytestconfig: pytest.Config) -> int:
     """Default timeout for Playwright operations (milliseconds)."""
     timeout = pytestconfig.getoption("--pw-timeout")
-    logging.getLogger(__name__).info("Playwright default timeout: %d ms", timeout)
+    logger.info("Playwright default timeout: %d ms", timeout)
     return timeout
 
 
+@pytest.fixture(scope="session")
+def block_resources(pytestconfig: pytest.Config) -> bool:
+    """Whether to abort image/font/media requests in browser contexts."""
+    return pytestconfig.getoption("--block-resources")
+
+
 @pytest.fixture(scope="session")
 def screenshot_dir(pytestconfig: pytest.Config) -> Path:
-    """Directory to store screenshots."""
-    directory = Path(pytestconfig.getoption("--screenshot-dir")).resolve()
-    directory.mkdir(parents=True, exist_ok=True)
-    return directory
+    """Directory to store screenshots (created in pytest_configure)."""
+    return pytestconfig.stash[SCREENSHOT_DIR_KEY]
 
 
 # =============================================================================
 # PLAYWRIGHT & BROWSER FIXTURES (ASYNC)
 # =============================================================================
 
+@asynccontextmanager
+async def _managed(
+    name: str,
+    factory: Callable[[], Awaitable[T]],
+    closer: Callable[[T], Awaitable[Any]],
+) -> AsyncIterator[T]:
+    """
+    Create a Playwright resource, log failures uniformly and always release it.
+
+    `factory` creates the resource; `closer` runs once the `async with` body
+    exits, whether the test passed or raised.
+    """
+    resource: Optional[T] = None
+    try:
+        resource = await factory()
+        logger.debug("Created %s.", name)
+        yield resource
+    except PWError as pw_err:
+        logger.exception("Playwright error in %s: %s", name, pw_err)
+        raise
+    except Exception as exc:
+        logger.exception("Unexpected error in %s: %s", name, exc)
+        raise
+    finally:
+        if resource is not None:
+            logger.debug("Closing %s...", name)
+            await closer(resource)
+
+
 @pytest.fixture(scope="session")
 async def playwright_instance() -> AsyncGenerator[Playwright, None]:
     """
@@ -180,16 +313,10 @@ async def playwright_instance() -> AsyncGenerator[Playwright, None]:
 
     Ensures proper startup and shutdown of Playwright.
     """
-    logger = logging.getLogger(__name__)
     logger.info("Starting Playwright...")
-    try:
-        async with async_playwright() as p:
-            yield p
-    except Exception as exc:
-        logger.exception("Error during Playwright session: %s", exc)
-        raise
-    finally:
-        logger.info("Playwright session finished.")
+    async with _managed("Playwright", async_playwright().start, lambda p: p.stop()) as playwright:
+        yield playwright
+    logger.info("Playwright session finished.")
 
 
 @pytest.fixture(scope="session")
@@ -203,33 +330,31 @@ async def browser(
 
     Uses Chromium by default; configurable via CLI.
     """
-    logger = logging.getLogger(__name__)
     logger.info("Launching browser: %s (headed=%s)", browser_name, headed)
 
-    browser: Optional[Browser] = None
-    try:
-        launch_kwargs: Dict[str, Any] = {
-            "headless": not headed,
-            "args": [
-                "--start-maximized",
-                "--disable-dev-shm-usage",
-                "--no-sandbox",
-            ],
-        }
-        browser_type = getattr(playwright_instance, browser_name)
-        browser = await browser_type.launch(**launch_kwargs)
+    launch_kwargs: Dict[str, Any] = {
+        "headless": not headed,
+        "args": [
+            "--start-maximized",
+            "--disable-dev-shm-usage",
+            "--no-sandbox",
+        ],
+    }
+    if browser_name == "chromium":
+        launch_kwargs["args"].extend(CHROMIUM_FAST_ARGS)
+        launch_kwargs["chromium_sandbox"] = False
+    browser_type = getattr(playwright_instance, browser_name)
+
+    async with _managed("browser", lambda: browser_type.launch(**launch_kwargs), lambda b: b.close()) as browser:
         yield browser
-    except PWError as pw_err:
-        logger.exception("Playwright error when launching browser: %s", pw_err)
-        raise
-    except Exception as exc:
-        logger.exception("Unexpected error when launching browser: %s", exc)
-        raise
-    finally:
-        if browser:
-            logger.info("Closing browser...")
-            await browser.close()
-            logger.info("Browser closed.")
+
+
+async def _abort_blocked_resource(route: Route) -> None:
+    """Route handler that drops heavy resources the tests never assert on."""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
 
 
 @pytest.fixture(scope="function")
@@ -237,59 +362,50 @@ async def browser_context(
     browser: Browser,
     base_url: str,
     pw_timeout: int,
+    block_resources: bool,
 ) -> AsyncGenerator[BrowserContext, None]:
     """
     Function-scoped BrowserContext.
 
-    Each test gets a fresh context for isolation.
+    Each test gets a fresh context, so cookies, permissions, localStorage,
+    sessionStorage and IndexedDB never carry over between tests.
     """
-    logger = logging.getLogger(__name__)
-    context: Optional[BrowserContext] = None
-    try:
+    async def _new_context() -> BrowserContext:
         context = await browser.new_context(
             base_url=base_url,
             viewport=DEFAULT_VIEWPORT,
         )
         context.set_default_timeout(pw_timeout)
-        logger.debug("Created new browser context with base_url=%s", base_url)
+        if block_resources:
+            await context.route("**/*", _abort_blocked_resource)
+        return context
+
+    async with _managed("browser_context", _new_context, lambda c: c.close()) as context:
         yield context
-    except PWError as pw_err:
-        logger.exception("Playwright error in browser_context: %s", pw_err)
-        raise
-    except Exception as exc:
-        logger.exception("Unexpected error in browser_context: %s", exc)
-        raise
-    finally:
-        if context:
-            logger.debug("Closing browser context...")
-            await context.close()
-            logger.debug("Browser context closed.")
 
 
 @pytest.fixture(scope="function")
-async def page(browser_context: BrowserContext) -> AsyncGenerator[Page, None]:
+async def page(
+    browser_context: BrowserContext,
+    request: pytest.FixtureRequest,
+    screenshot_dir: Path,
+) -> AsyncGenerator[Page, None]:
     """
     Function-scoped Page fixture.
 
-    Provides a new page for each test.
+    Provides a new page for each test in its own browser context. Takes a
+    screenshot before closing if the test failed (unless the test also uses
+    `auth_page`, `authenticated_page` or `basic_config_page`, which take
+    precedence).
     """
-    logger = logging.getLogger(__name__)
-    page: Optional[Page] = None
-    try:
-        page = await browser_context.new_page()
-        logger.debug("New page created.")
+    async def _close_page(page: Page) -> None:
+        screenshot_owners = {"auth_page", "authenticated_page", "basic_config_page"}
+        if not screenshot_owners & set(request.fixturenames):
+            await _capture_failure_screenshot(request, page, screenshot_dir)
+        await page.close()
+
+    async with _managed("page", browser_context.new_page, _close_page) as page:
         yield page
-    except PWError as pw_err:
-        logger.exception("Playwright error in page fixture: %s", pw_err)
-        raise
-    except Exception as exc:
-        logger.exception("Unexpected error in page fixture: %s", exc)
-        raise
-    finally:
-        if page:
-            logger.debug("Closing page...")
-            await page.close()
-            logger.debug("Page closed.")
 
 
 # =============================================================================
@@ -298,13 +414,17 @@ async def page(browser_context: BrowserContext) -> AsyncGenerator[Page, None]:
 
 SESSION_STORAGE_FILE = Path(".auth") / "dev_session_storage.json"
 
+# Held by the one xdist worker performing the login; the others wait for
+# SESSION_STORAGE_FILE instead of logging in themselves.
+SESSION_LOGIN_LOCK = SESSION_STORAGE_FILE.with_suffix(".lock")
+SESSION_LOGIN_WAIT_S = float(os.getenv("PW_SESSION_LOGIN_WAIT_S", "120"))
+
 
 async def _perform_login(
     page: Page,
     username: str,
     password: str,
     base_url: str,
-    logger: logging.Logger,
 ) -> None:
     """
     Perform login steps on the given page.
@@ -316,15 +436,20 @@ async def _perform_login(
 
     # NOTE: Selectors below are placeholders and must be adjusted to real app
     try:
-        # Example selectors - replace with actual ones
-        await page.fill("input[name='username']", username)
-        await page.fill("input[name='password']", password)
-        await page.click("button[type='submit']")
-
-        # Wait for a post-login element or URL change
-        # Adjust this condition to your application's behavior
-        await page.wait_for_load_state("networkidle")
-        logger.info("Login flow completed (network idle).")
+        # Example locators - replace with actual ones. Password inputs have
+        # no ARIA role, so that field is located by its label instead.
+        username_input = page.get_by_role("textbox", name="Username")
+        password_input = page.get_by_label("Password")
+        sign_in_button = page.get_by_role("button", name="Sign In")
+
+        await username_input.fill(username)
+        await password_input.fill(password)
+        await sign_in_button.click()
+
+        # Wait for a post-login landmark rather than network idle, which
+        # stalls on pages with keep-alive polling or open connections
+        await page.wait_for_selector(POST_LOGIN_SELECTOR, state="visible", timeout=DEFAULT_TIMEOUT)
+        logger.info("Login flow completed (post-login element visible).")
     except PWError as pw_err:
         logger.exception("Playwright error during login: %s", pw_err)
         raise
@@ -333,16 +458,58 @@ async def _perform_login(
         raise
 
 
-async def _save_storage_state(context: BrowserContext, storage_file: Path, logger: logging.Logger) -> None:
-    """Save storage state (cookies, localStorage, etc.) to a file for reuse."""
+def _save_storage_state(state: Dict[str, Any], storage_file: Path) -> None:
+    """
+    Save storage state (cookies, localStorage, etc.) to a file for reuse.
+
+    Written to a temp file and moved into place, so readers never see a
+    partially written file.
+    """
     storage_file.parent.mkdir(parents=True, exist_ok=True)
-    state = await context.storage_state()
-    storage_file.write_text(json.dumps(state, indent=2))
+    tmp_file = storage_file.with_name(f"{storage_file.name}.{os.getpid()}.tmp")
+    tmp_file.write_text(json.dumps(state, indent=2))
+    os.replace(tmp_file, storage_file)
     logger.info("Saved storage state to %s", storage_file)
 
 
-def _load_password_from_env(logger: logging.Logger) -> str:
-    """Load password from environment variable, raising clear error if missing."""
+def _load_storage_state(storage_file: Path) -> Optional[Dict[str, Any]]:
+    """Load a saved storage state, or None if it is missing or unreadable."""
+    try:
+        return json.loads(storage_file.read_text())
+    except FileNotFoundError:
+        return None
+    except ValueError as exc:
+        logger.warning("Ignoring unreadable storage state %s: %s", storage_file, exc)
+        return None
+
+
+def _try_acquire_login_lock() -> bool:
+    """Atomically create SESSION_LOGIN_LOCK; False if another worker holds it."""
+    SESSION_LOGIN_LOCK.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        os.close(os.open(SESSION_LOGIN_LOCK, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+    except FileExistsError:
+        return False
+    return True
+
+
+async def _wait_for_storage_state(timeout_s: float) -> Optional[Dict[str, Any]]:
+    """Poll for the state file written by the worker holding the login lock."""
+    deadline = time.monotonic() + timeout_s
+    while time.monotonic() < deadline:
+        state = _load_storage_state(SESSION_STORAGE_FILE)
+        if state is not None:
+            return state
+        if not SESSION_LOGIN_LOCK.exists():
+            # The login worker gave up without writing a state file
+            return None
+        await asyncio.sleep(0.5)
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def _load_password_from_env() -> str:
+    """Load password from environment variable (cached), raising clear error if missing."""
     password = os.getenv(DEFAULT_PASSWORD_ENV_VAR)
     if not password:
         logger.error(
@@ -356,117 +523,273 @@ def _load_password_from_env(logger: logging.Logger) -> str:
     return password
 
 
+def _share_state_across_workers() -> bool:
+    """True when pytest-xdist runs more than one worker process."""
+    return int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", "1")) > 1
+
+
 @pytest.fixture(scope="session")
 async def authenticated_storage_state(
-    playwright_instance: Playwright,
-    browser_name: str,
+    browser: Browser,
     base_url: str,
-) -> Path:
+) -> Dict[str, Any]:
     """
-    Session-scoped fixture that ensures a valid authenticated storage state file.
+    Session-scoped fixture that provides authenticated storage state as a dict.
 
-    Login is performed once per session; subsequent tests reuse the storage state.
+    Login is performed once per session; subsequent tests reuse the in-memory
+    state. Under xdist the first worker to take SESSION_LOGIN_LOCK logs in
+    and writes SESSION_STORAGE_FILE; the other workers wait for that file
+    (falling back to their own login after SESSION_LOGIN_WAIT_S). The login
+    runs in a short-lived context of the session `browser`.
     """
-    logger = logging.getLogger(__name__)
-    storage_file = SESSION_STORAGE_FILE
-
     # If storage state already exists, reuse it
-    if storage_file.exists():
-        logger.info("Using existing authenticated storage state: %s", storage_file)
-        return storage_file
+    state: Optional[Dict[str, Any]] = _load_storage_state(SESSION_STORAGE_FILE)
+    if state is not None:
+        logger.info("Using existing authenticated storage state: %s", SESSION_STORAGE_FILE)
+        return state
+
+    share_state = _share_state_across_workers()
+    holds_lock = share_state and _try_acquire_login_lock()
+    if share_state and not holds_lock:
+        logger.info("Waiting for another worker to log in...")
+        state = await _wait_for_storage_state(SESSION_LOGIN_WAIT_S)
+        if state is not None:
+            return state
+        logger.warning("No shared storage state appeared; logging in on this worker.")
 
     logger.info("No existing storage state found. Performing initial login...")
 
-    password = _load_password_from_env(logger)
+    password = _load_password_from_env()
     username = DEFAULT_USERNAME
 
-    browser: Optional[Browser] = None
     context: Optional[BrowserContext] = None
-    page: Optional[Page] = None
 
     try:
-        browser_type = getattr(playwright_instance, browser_name)
-        browser = await browser_type.launch(headless=True)
         context = await browser.new_context(base_url=base_url, viewport=DEFAULT_VIEWPORT)
         page = await context.new_page()
 
-        await _perform_login(page, username, password, base_url, logger)
-        await _save_storage_state(context, storage_file, logger)
+        await _perform_login(page, username, password, base_url)
+        state = await context.storage_state()
+        if share_state:
+            _save_storage_state(state, SESSION_STORAGE_FILE)
         logger.info("Authenticated storage state created.")
     except Exception:
         logger.exception("Failed to create authenticated storage state.")
         raise
     finally:
-        if page:
-            await page.close()
+        if holds_lock:
+            SESSION_LOGIN_LOCK.unlink(missing_ok=True)
         if context:
+            # Closing the context also closes the login page
             await context.close()
-        if browser:
-            await browser.close()
 
-    return storage_file
+    return state
+
+
+@pytest.fixture(scope="session")
+async def auth_context_queue(
+    browser: Browser,
+    authenticated_storage_state: Dict[str, Any],
+    base_url: str,
+    pw_timeout: int,
+    block_resources: bool,
+) -> AsyncGenerator["asyncio.Queue[Any]", None]:
+    """
+    Session-scoped queue of ready-to-use authenticated contexts.
+
+    A background task keeps up to AUTH_CONTEXT_PREFETCH contexts created
+    ahead of time, so context startup overlaps with the running test instead
+    of delaying the next one. If creating a context fails, the exception is
+    queued so the waiting test fails instead of hanging.
+    """
+    queue: "asyncio.Queue[Any]" = asyncio.Queue(maxsize=max(1, AUTH_CONTEXT_PREFETCH))
+
+    async def _refill() -> None:
+        while True:
+            try:
+                context = await browser.new_context(
+                    base_url=base_url,
+                    viewport=DEFAULT_VIEWPORT,
+                    storage_state=authenticated_storage_state,
+                )
+                context.set_default_timeout(pw_timeout)
+                if block_resources:
+                    await context.route("**/*", _abort_blocked_resource)
+            except Exception as exc:
+                logger.exception("Failed to prefetch authenticated context: %s", exc)
+                await queue.put(exc)
+                return
+            try:
+                await queue.put(context)
+            except asyncio.CancelledError:
+                await context.close()
+                raise
+            logger.debug("Prefetched authenticated context.")
+
+    refill_task = asyncio.create_task(_refill())
+    try:
+        yield queue
+    finally:
+        refill_task.cancel()
+        try:
+            await refill_task
+        except asyncio.CancelledError:
+            pass
+        while not queue.empty():
+            item = queue.get_nowait()
+            if isinstance(item, BrowserContext):
+                await item.close()
 
 
 @pytest.fixture(scope="function")
 async def auth_context(
+    auth_context_queue: "asyncio.Queue[Any]",
+) -> AsyncGenerator[BrowserContext, None]:
+    """
+    Function-scoped authenticated BrowserContext.
+
+    Uses session storage state to avoid repeated logins; the context is taken
+    from the prefetch queue rather than created on demand.
+    """
+    async def _take_context() -> BrowserContext:
+        item = await auth_context_queue.get()
+        if isinstance(item, BaseException):
+            # Leave the error queued for the remaining tests
+            auth_context_queue.put_nowait(item)
+            raise item
+        return item
+
+    async with _managed("auth_context", _take_context, lambda c: c.close()) as context:
+        yield context
+
+
+@pytest.fixture(scope="function")
+async def auth_page(
+    auth_context: BrowserContext,
+    request: pytest.FixtureRequest,
+    screenshot_dir: Path,
+) -> AsyncGenerator[Page, None]:
+    """
+    Function-scoped authenticated Page.
+
+    Tests using this fixture start from an authenticated state. Takes a
+    screenshot before closing if the test failed.
+    """
+    async def _close_page(page: Page) -> None:
+        await _capture_failure_screenshot(request, page, screenshot_dir)
+        await page.close()
+
+    async with _managed("auth_page", auth_context.new_page, _close_page) as page:
+        yield page
+
+
+# =============================================================================
+# SHARED PAGES
+# =============================================================================
+
+@pytest.fixture(scope="session")
+async def authenticated_context(
     browser: Browser,
-    authenticated_storage_state: Path,
+    authenticated_storage_state: Dict[str, Any],
     base_url: str,
     pw_timeout: int,
+    block_resources: bool,
 ) -> AsyncGenerator[BrowserContext, None]:
     """
-    Function-scoped authenticated BrowserContext.
+    Session-scoped authenticated BrowserContext.
 
-    Uses session storage state to avoid repeated logins.
+    Created once from the cached storage state and shared by the tests using
+    `basic_config_page`, so the login cost is paid once per session. Cookies
+    are never cleared here, as that would log out every later test.
     """
-    logger = logging.getLogger(__name__)
-    context: Optional[BrowserContext] = None
-    try:
+    async def _new_context() -> BrowserContext:
         context = await browser.new_context(
             base_url=base_url,
             viewport=DEFAULT_VIEWPORT,
-            storage_state=authenticated_storage_state.read_text(),
+            storage_state=authenticated_storage_state,
         )
         context.set_default_timeout(pw_timeout)
-        logger.debug("Authenticated context created with storage state: %s", authenticated_storage_state)
+        if block_resources:
+            await context.route("**/*", _abort_blocked_resource)
+        return context
+
+    async with _managed("authenticated_context", _new_context, lambda c: c.close()) as context:
         yield context
-    except PWError as pw_err:
-        logger.exception("Playwright error in auth_context: %s", pw_err)
-        raise
-    except Exception as exc:
-        logger.exception("Unexpected error in auth_context: %s", exc)
-        raise
-    finally:
-        if context:
-            logger.debug("Closing authenticated context...")
-            await context.close()
-            logger.debug("Authenticated context closed.")
 
 
 @pytest.fixture(scope="function")
-async def auth_page(auth_context: BrowserContext) -> AsyncGenerator[Page, None]:
+async def authenticated_page(
+    auth_context: BrowserContext,
+    base_url: str,
+    request: pytest.FixtureRequest,
+    screenshot_dir: Path,
+) -> AsyncGenerator[Page, None]:
     """
-    Function-scoped authenticated Page.
+    Function-scoped Page in its own authenticated context.
 
-    Tests using this fixture start from an authenticated state.
+    Each test gets a prefetched context from `auth_context`, so tests share
+    no cookies, storage or pages and can run in parallel (pytest-xdist).
+    Opens the base URL so tests start from the logged-in landing page. Takes
+    a screenshot before closing if the test failed.
     """
-    logger = logging.getLogger(__name__)
-    page: Optional[Page] = None
-    try:
+    async def _new_page() -> Page:
         page = await auth_context.new_page()
-        logger.debug("Authenticated page created.")
+        await page.goto(base_url, wait_until="domcontentloaded")
+        return page
+
+    async def _close_page(page: Page) -> None:
+        await _capture_failure_screenshot(request, page, screenshot_dir)
+        await page.close()
+
+    async with _managed("authenticated_page", _new_page, _close_page) as page:
+        yield page
+
+
+@pytest.fixture(scope="session")
+async def _basic_config_session_page(
+    authenticated_context: BrowserContext,
+) -> AsyncGenerator[Page, None]:
+    """Session-scoped authenticated Page shared by `basic_config_page`."""
+    async with _managed(
+        "basic_config_page", authenticated_context.new_page, lambda p: p.close()
+    ) as page:
+        yield page
+
+
+@pytest.fixture(scope="function")
+async def basic_config_page(
+    _basic_config_session_page: Page,
+    base_url: str,
+    request: pytest.FixtureRequest,
+    screenshot_dir: Path,
+) -> AsyncGenerator[Page, None]:
+    """
+    Authenticated Page on a populated Basic Configuration form.
+
+    The page itself is opened once per session; before each test it is
+    reloaded (or, on first use, opened on BASIC_CONFIG_URL or the base URL)
+    so unsaved edits from the previous test are discarded, and the test
+    starts once `wait_for_form_ready` passes, navigating through the menus
+    if needed. Saved values still carry over, so tests must read their
+    baseline from the page rather than assume defaults. Takes a screenshot
+    if the test failed.
+    """
+    page = _basic_config_session_page
+    locators = BasicConfigLocators(page)
+
+    if page.url == "about:blank":
+        await page.goto(BASIC_CONFIG_URL or base_url, wait_until="domcontentloaded")
+    else:
+        await page.reload(wait_until="domcontentloaded")
+    try:
+        await wait_for_form_ready(locators, timeout=2_000)
+    except PWTimeoutError:
+        await navigate_to_basic_configuration(locators)
+
+    try:
         yield page
-    except PWError as pw_err:
-        logger.exception("Playwright error in auth_page fixture: %s", pw_err)
-        raise
-    except Exception as exc:
-        logger.exception("Unexpected error in auth_page fixture: %s", exc)
-        raise
     finally:
-        if page:
-            logger.debug("Closing authenticated page...")
-            await page.close()
-            logger.debug("Authenticated page closed.")
+        await _capture_failure_screenshot(request, page, screenshot_dir)
 
 
 # =============================================================================
@@ -485,25 +808,36 @@ def test_data_dir() -> Path:
     return data_dir
 
 
+@pytest.fixture(scope="session")
+def _test_data_base(test_data_dir: Path) -> Dict[str, Any]:
+    """Invariant part of `test_data`, built once per session and copied per test."""
+    return {
+        "env": DEFAULT_ENV,
+        "paths": {
+            "data_dir": str(test_data_dir),
+        },
+    }
+
+
 @pytest.fixture(scope="function")
-def test_data(test_data_dir: Path) -> Dict[str, Any]:
+def test_data(_test_data_base: Dict[str, Any]) -> Dict[str, Any]:
     """
     Test data management fixture.
 
     Returns a dict that can be used / modified by tests. If you prefer
     loading from JSON/YAML per test, you can extend this to read files
     based on node name or markers.
+
+    Each test gets its own deep copy of the session-wide defaults, so
+    changes never leak into other tests.
     """
     # Example default data structure; customize as needed.
     return {
-        "env": DEFAULT_ENV,
+        **copy.deepcopy(_test_data_base),
         "sample_user": {
             "username": "test_user",
             "roles": ["admin"],
         },
-        "paths": {
-            "data_dir": str(test_data_dir),
-        },
     }
 
 
@@ -511,62 +845,79 @@ def test_data(test_data_dir: Path) -> Dict[str, Any]:
 # SCREENSHOT ON FAILURE
 # =============================================================================
 
+def pytest_collection_modifyitems(config: pytest.Config, items: list) -> None:
+    """
+    Precompute a filesystem-safe name per test for failure screenshots, and
+    keep `destructive` tests from running while other tests still need the
+    shared state they remove (e.g. TC_003 deletes LP-01).
+
+    Ordering constraint: destructive tests must start only after every other
+    test has finished. In a single process they are moved to the end. Under
+    pytest-xdist, ordering only holds within one worker, so they are
+    deselected instead and must be run in a separate serial pass afterwards:
+
+        pytest -n auto && pytest -m destructive
+    """
+    for item in items:
+        item._safe_name = item.nodeid.replace("::", "__").replace("/", "_").replace(" ", "_")
+
+    # Only xdist workers collect tests and carry `workerinput`, so every
+    # worker makes the same decision.
+    if hasattr(config, "workerinput"):
+        destructive = [item for item in items if item.get_closest_marker("destructive")]
+        if destructive:
+            config.hook.pytest_deselected(items=destructive)
+            items[:] = [item for item in items if not item.get_closest_marker("destructive")]
+        return
+
+    # Stable sort: relative order within each group is preserved
+    items.sort(key=lambda item: item.get_closest_marker("destructive") is not None)
+
+
 @pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_makereport(item: pytest.Item, call: pytest.CallInfo):
     """
     Hook to add test outcome information to the item for later use
     (e.g., in fixtures).
+
+    Only the call-phase report is read (by the failure screenshot helper),
+    so setup/teardown reports are not stored.
     """
     outcome = yield
     rep = outcome.get_result()
 
     # Attach result to test item for access in fixtures
-    setattr(item, "rep_" + rep.when, rep)
+    if rep.when == "call":
+        item.rep_call = rep
 
 
-@pytest.fixture(autouse=True)
-async def screenshot_on_failure(
+async def _capture_failure_screenshot(
     request: pytest.FixtureRequest,
+    page: Page,
     screenshot_dir: Path,
-) -> AsyncGenerator[None, None]:
+) -> None:
     """
-    Autouse fixture that captures a screenshot on test failure.
+    Capture a screenshot of `page` if the test body (call phase) failed.
 
-    It attempts to locate a Playwright Page from the test's fixtures
-    (prefers 'auth_page', then 'page').
+    Called from the page fixtures' teardown while the page is still open,
+    so passing tests cost only an attribute lookup.
     """
-    yield  # Run the test first
-
-    logger = logging.getLogger(__name__)
-    # Only care about call phase (actual test body)
-    rep: pytest.TestReport = getattr(request.node, "rep_call", None)  # type: ignore[assignment]
-    if not rep or rep.passed or rep.skipped:
-        return
-
-    # Try to get a Page instance from fixtures
-    page: Optional[Page] = None
-    for candidate in ("auth_page", "page"):
-        if candidate in request.fixturenames:
-            maybe_page = request.getfixturevalue(candidate)
-            if isinstance(maybe_page, Page):
-                page = maybe_page
-                break
-
-    if not page:
-        logger.warning(
-            "Test %s failed but no Playwright Page fixture ('page' or 'auth_page') found; "
-            "skipping screenshot.",
-            request.node.nodeid,
-        )
+    rep: Optional[pytest.TestReport] = getattr(request.node, "rep_call", None)
+    if not rep or not rep.failed:
         return
 
     # Build screenshot path
-    test_name = request.node.nodeid.replace("::", "_").replace("/", "_")
-    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S_%f")
-    screenshot_path = screenshot_dir / f"{test_name}_{timestamp}.png"
+    test_name = request.node._safe_name
+    screenshot_path = screenshot_dir / f"{test_name}_{time.time_ns()}.jpg"
 
     try:
-        await page.screenshot(path=str(screenshot_path), full_page=True)
+        data = await page.screenshot(
+            full_page=SCREENSHOT_FULL_PAGE,
+            type="jpeg",
+            quality=SCREENSHOT_JPEG_QUALITY,
+        )
+        # Write on a worker thread so the disk I/O doesn't block the event loop
+        await asyncio.get_running_loop().run_in_executor(None, screenshot_path.write_bytes, data)
         logger.info("Saved failure screenshot for %s to %s", request.node.nodeid, screenshot_path)
     except PWError as pw_err:
         logger.exception(
@@ -579,4 +930,4 @@ async def screenshot_on_failure(
             "Unexpected error while taking screenshot for failed test %s: %s",
             request.node.nodeid,
             exc,
-        )
\ No newline at end of file
+        )
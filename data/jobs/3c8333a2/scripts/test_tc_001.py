@@ -1,29 +1,31 @@
 import asyncio
 import logging
-from typing import Optional
 
 import pytest
-from playwright.async_api import Page, Browser, Error, TimeoutError, expect
+from playwright.async_api import Page, Error, TimeoutError, expect
+
+from basic_config_helpers import (
+    BasicConfigLocators,
+    assert_checkbox_checked,
+    ensure_checked,
+    get_basic_config_snapshot,
+    get_input_value,
+    navigate_to_basic_configuration,
+    read_committed_config,
+    safe_click,
+    trigger_reset_and_confirm,
+    wait_for_form_ready,
+)
 
 
 logger = logging.getLogger(__name__)
 
 
-@pytest.mark.asyncio
-async def test_save_basic_profiler_configuration_with_dhcpv6(
-    authenticated_page: Page,
-    browser: Browser,
-) -> None:
+async def _save_persists(locators: BasicConfigLocators) -> None:
     """
     TC_001: Save basic profiler configuration with valid settings (including DHCPv6 enable)
 
-    This test validates that an admin can successfully configure and save the basic
-    profiler basic configuration, including enabling DHCPv6 packet capturing and
-    DHCPv6 sniffing over external port, and that these settings persist after reload.
-
     Steps:
-        1. Log in to the PPS admin console (handled by `authenticated_page` fixture).
-        2. Navigate to Profiler > Profiler Configuration > Settings > Basic Configuration.
         3. Verify that existing values are displayed.
         4. Enable "DHCPv6 packet capturing".
         5. Enable "DHCPv6 sniffing over external port".
@@ -38,244 +40,253 @@ async def test_save_basic_profiler_configuration_with_dhcpv6(
         - UI displays a clear success confirmation.
         - After reload, DHCPv6 options remain enabled and polling interval is preserved.
     """
-    page: Page = authenticated_page
-
-    # Helper locators (update selectors to match actual application DOM)
-    profiler_menu_locator = page.get_by_role("link", name="Profiler")
-    profiler_config_menu_locator = page.get_by_role(
-        "link", name="Profiler Configuration"
-    )
-    settings_menu_locator = page.get_by_role("link", name="Settings")
-    basic_config_link_locator = page.get_by_role(
-        "link", name="Basic Configuration"
-    )
-
-    dhcpv6_capture_checkbox = page.get_by_label(
-        "Enable DHCPv6 packet capturing", exact=True
-    )
-    dhcpv6_sniffing_checkbox = page.get_by_label(
-        "Enable DHCPv6 sniffing over external port", exact=True
-    )
-    polling_interval_input = page.get_by_label(
-        "Polling interval", exact=False
-    )  # relax exact if label is longer
-
-    save_changes_button = page.get_by_role("button", name="Save Changes")
-    success_message_locator = page.locator(
-        "text=Changes saved successfully"
-    )
-
-    # Optional: more generic success locator if exact text differs
-    generic_success_locator = page.locator(
-        "css=.msg-success, .alert-success, .ui-message-success"
-    )
-
-    async def safe_click(locator, description: str) -> None:
-        """Click with basic error handling and logging."""
-        try:
-            await expect(locator).to_be_visible(timeout=10_000)
-            await locator.click()
-        except TimeoutError as exc:
-            logger.error("Timed out waiting to click %s: %s", description, exc)
-            pytest.fail(f"Timed out waiting to click {description}")
-        except Error as exc:
-            logger.error("Failed to click %s: %s", description, exc)
-            pytest.fail(f"Failed to click {description}: {exc}")
-
-    async def assert_checkbox_checked(locator, description: str) -> None:
-        """Assert that a checkbox is checked with explicit error message."""
-        try:
-            await expect(locator).to_be_visible(timeout=10_000)
-            await expect(locator).to_be_checked()
-        except AssertionError as exc:
-            logger.error("%s is not checked as expected: %s", description, exc)
-            pytest.fail(f"{description} is not checked as expected")
-        except TimeoutError as exc:
-            logger.error("Timed out waiting for %s to be visible: %s", description, exc)
-            pytest.fail(f"Timed out waiting for {description} to be visible")
-
-    async def get_input_value(locator, description: str) -> Optional[str]:
-        """Get the value of an input with error handling."""
-        try:
-            await expect(locator).to_be_visible(timeout=10_000)
-            value = await locator.input_value()
-            logger.info("%s current value: %s", description, value)
-            return value
-        except TimeoutError as exc:
-            logger.error("Timed out waiting for %s input: %s", description, exc)
-            pytest.fail(f"Timed out waiting for {description} input")
-        except Error as exc:
-            logger.error("Failed to read %s input value: %s", description, exc)
-            pytest.fail(f"Failed to read {description} input value")
-        return None
-
-    # ----------------------------------------------------------------------
-    # Step 1: Log in to the PPS admin console
-    # ----------------------------------------------------------------------
-    # This step is handled by the `authenticated_page` fixture.
-    # We just verify we are on an admin page and reachable.
-    try:
-        await expect(page).to_have_url(
-            lambda url: "https://" in url and "admin" in url,
-            timeout=15_000,
-        )
-    except TimeoutError:
-        logger.warning(
-            "Could not confirm admin URL pattern; continuing with navigation."
-        )
-
-    # ----------------------------------------------------------------------
-    # Step 2: Navigate to Profiler > Profiler Configuration > Settings > Basic Configuration
-    # ----------------------------------------------------------------------
-    await safe_click(profiler_menu_locator, "Profiler menu")
-    await safe_click(profiler_config_menu_locator, "Profiler Configuration menu")
-    await safe_click(settings_menu_locator, "Settings menu")
-    await safe_click(basic_config_link_locator, "Basic Configuration link")
-
-    # Ensure Basic Configuration page is loaded
-    basic_config_header = page.get_by_role("heading", name="Basic Configuration")
-    try:
-        await expect(basic_config_header).to_be_visible(timeout=10_000)
-    except TimeoutError as exc:
-        logger.error("Basic Configuration page did not load: %s", exc)
-        pytest.fail("Basic Configuration page did not load")
+    page = locators.page
 
     # ----------------------------------------------------------------------
     # Step 3: Verify that existing values are displayed
     # ----------------------------------------------------------------------
-    # At minimum, check that key controls are visible.
+    # At minimum, check that key controls are visible (concurrently, since they
+    # are rendered by the same page load).
     try:
-        await expect(dhcpv6_capture_checkbox).to_be_visible(timeout=10_000)
-        await expect(dhcpv6_sniffing_checkbox).to_be_visible(timeout=10_000)
-        await expect(polling_interval_input).to_be_visible(timeout=10_000)
-    except TimeoutError as exc:
+        await asyncio.gather(
+            expect(locators.dhcpv6_capture).to_be_visible(timeout=10_000),
+            expect(locators.dhcpv6_sniff).to_be_visible(timeout=10_000),
+            expect(locators.polling).to_be_visible(timeout=10_000),
+        )
+    except (AssertionError, TimeoutError) as exc:
         logger.error("Basic configuration fields not visible: %s", exc)
         pytest.fail("Basic configuration fields not visible")
 
-    # Capture existing values (for verification that they remain unchanged where required)
-    original_polling_interval = await get_input_value(
-        polling_interval_input, "Polling interval"
-    )
-
     # ----------------------------------------------------------------------
     # Step 4: Check the checkbox “Enable DHCPv6 packet capturing”
-    # ----------------------------------------------------------------------
-    try:
-        await expect(dhcpv6_capture_checkbox).to_be_visible(timeout=10_000)
-        is_checked = await dhcpv6_capture_checkbox.is_checked()
-        if not is_checked:
-            await dhcpv6_capture_checkbox.check()
-    except Error as exc:
-        logger.error("Failed to enable DHCPv6 packet capturing: %s", exc)
-        pytest.fail(f"Failed to enable DHCPv6 packet capturing: {exc}")
-
-    # ----------------------------------------------------------------------
     # Step 5: Check the checkbox “Enable DHCPv6 sniffing over external port”
     # ----------------------------------------------------------------------
-    try:
-        await expect(dhcpv6_sniffing_checkbox).to_be_visible(timeout=10_000)
-        is_checked = await dhcpv6_sniffing_checkbox.is_checked()
-        if not is_checked:
-            await dhcpv6_sniffing_checkbox.check()
-    except Error as exc:
-        logger.error("Failed to enable DHCPv6 sniffing over external port: %s", exc)
-        pytest.fail(f"Failed to enable DHCPv6 sniffing over external port: {exc}")
+    # The two checkboxes are independent, so handle them concurrently.
+    await asyncio.gather(
+        ensure_checked(locators.dhcpv6_capture, "DHCPv6 packet capturing"),
+        ensure_checked(locators.dhcpv6_sniff, "DHCPv6 sniffing over external port"),
+    )
 
     # ----------------------------------------------------------------------
     # Step 6: Ensure polling interval (if present) remains 720
     # ----------------------------------------------------------------------
-    current_polling_interval = await get_input_value(
-        polling_interval_input, "Polling interval"
-    )
-
-    # If the field is empty or different, set it to 720 to meet the requirement.
+    # The field's visibility was asserted in Step 3, so read the value directly
+    # and only re-read it after writing.
     target_polling_interval = "720"
-    if current_polling_interval != target_polling_interval:
-        try:
-            await polling_interval_input.fill(target_polling_interval)
-        except Error as exc:
-            logger.error("Failed to set polling interval to %s: %s", target_polling_interval, exc)
-            pytest.fail(f"Failed to set polling interval to {target_polling_interval}")
+    try:
+        polling_interval = await locators.polling.input_value()
+        logger.info("Polling interval current value: %s", polling_interval)
+
+        # If the field is empty or different, set it to 720 to meet the requirement.
+        if polling_interval != target_polling_interval:
+            await locators.polling.fill(target_polling_interval)
+            polling_interval = await locators.polling.input_value()
+    except Error as exc:
+        logger.error("Failed to set polling interval to %s: %s", target_polling_interval, exc)
+        pytest.fail(f"Failed to set polling interval to {target_polling_interval}")
 
     # Assert that the value is now 720
-    updated_polling_interval = await get_input_value(
-        polling_interval_input, "Polling interval"
-    )
     assert (
-        updated_polling_interval == target_polling_interval
-    ), f"Polling interval expected to be {target_polling_interval}, got {updated_polling_interval}"
+        polling_interval == target_polling_interval
+    ), f"Polling interval expected to be {target_polling_interval}, got {polling_interval}"
 
     # ----------------------------------------------------------------------
     # Step 7: Click “Save Changes”
     # ----------------------------------------------------------------------
-    await safe_click(save_changes_button, "Save Changes button")
+    await safe_click(locators.save, "Save Changes button")
 
     # ----------------------------------------------------------------------
     # Step 8: Confirm that a success message is displayed
     # ----------------------------------------------------------------------
-    success_assertion_errors = []
-
+    # Wait on the exact message and the generic success banner at once
     try:
-        await expect(success_message_locator).to_be_visible(timeout=15_000)
-    except TimeoutError as exc:
-        success_assertion_errors.append(str(exc))
-
-    if success_assertion_errors:
-        # Try generic success locator as a fallback
-        try:
-            await expect(generic_success_locator).to_be_visible(timeout=10_000)
-        except TimeoutError:
-            logger.error(
-                "Success message not found after saving changes: %s",
-                "; ".join(success_assertion_errors),
-            )
-            pytest.fail("Success message not displayed after saving changes")
+        await expect(
+            locators.success_message.or_(locators.generic_success)
+        ).to_be_visible(timeout=15_000)
+    except (AssertionError, TimeoutError) as exc:
+        logger.error("Success message not found after saving changes: %s", exc)
+        pytest.fail("Success message not displayed after saving changes")
 
     # ----------------------------------------------------------------------
     # Step 9: Refresh the browser page or navigate away and back to Basic Configuration
     # ----------------------------------------------------------------------
     # Simpler and less brittle: reload the page and re-open Basic Configuration
+    # (domcontentloaded: the header wait below is the real readiness signal)
     try:
-        await page.reload(wait_until="networkidle")
+        await page.reload(wait_until="domcontentloaded")
     except Error as exc:
         logger.error("Failed to reload the page: %s", exc)
         pytest.fail(f"Failed to reload the page after saving: {exc}")
 
-    # Re-navigate in case reload changes current menu context
-    await safe_click(profiler_menu_locator, "Profiler menu (post-save)")
-    await safe_click(
-        profiler_config_menu_locator, "Profiler Configuration menu (post-save)"
-    )
-    await safe_click(settings_menu_locator, "Settings menu (post-save)")
-    await safe_click(
-        basic_config_link_locator, "Basic Configuration link (post-save)"
-    )
-
+    # Reload keeps the URL, so the page is normally still Basic Configuration;
+    # only re-navigate if the reload changed the current menu context.
     try:
-        await expect(basic_config_header).to_be_visible(timeout=10_000)
-    except TimeoutError as exc:
-        logger.error("Basic Configuration page did not load after reload: %s", exc)
-        pytest.fail("Basic Configuration page did not load after reload")
+        await wait_for_form_ready(locators, timeout=2_000)
+    except TimeoutError:
+        await navigate_to_basic_configuration(locators, " (post-save)")
 
     # ----------------------------------------------------------------------
     # Step 10: Verify that both DHCPv6-related checkboxes are still checked
     #         and polling interval is unchanged
     # ----------------------------------------------------------------------
     await assert_checkbox_checked(
-        dhcpv6_capture_checkbox,
+        locators.dhcpv6_capture,
         "Enable DHCPv6 packet capturing checkbox after reload",
     )
     await assert_checkbox_checked(
-        dhcpv6_sniffing_checkbox,
+        locators.dhcpv6_sniff,
         "Enable DHCPv6 sniffing over external port checkbox after reload",
     )
 
     persisted_polling_interval = await get_input_value(
-        polling_interval_input, "Polling interval after reload"
+        locators.polling, "Polling interval after reload"
     )
     assert (
         persisted_polling_interval == target_polling_interval
     ), (
         f"Polling interval expected to remain {target_polling_interval} after reload, "
         f"but found {persisted_polling_interval}"
-    )
\ No newline at end of file
+    )
+
+
+async def _reset_reverts(locators: BasicConfigLocators) -> None:
+    """
+    TC_002: Reset basic profiler configuration to defaults
+
+    Steps:
+        2. Note current values (e.g., DHCPv6 enabled, polling interval `600`).
+        3. Change polling interval to `500` and uncheck “Enable DHCPv6 packet capturing”.
+        4. Do NOT click Save Changes.
+        5. Click `Reset`.
+        6. Confirm reset if confirmation dialog appears.
+        7. Observe all fields on the basic configuration form.
+
+    Expected:
+        - Unsaved changes are discarded.
+        - All fields revert to last saved configuration or documented default.
+        - No changes are committed to system configuration.
+    """
+    # Step 2: Note current values (assumed to be last saved configuration)
+    baseline_config = await get_basic_config_snapshot(locators)
+    logger.info("Captured original basic configuration: %s", baseline_config)
+
+    # Sanity check: ensure we have non-empty polling interval
+    assert baseline_config["polling_interval"], (
+        "Polling interval field is empty; expected a valid saved value."
+    )
+
+    # Step 3 & 4: Apply changes but do NOT save
+    try:
+        # Change polling interval to 500 (fill clears the field first)
+        await locators.polling.fill("500")
+
+        # Uncheck DHCPv6 if currently checked (the polling interval change
+        # already guarantees a delta for Reset to discard)
+        dhcpv6_was_enabled = baseline_config["dhcpv6_enabled"]
+        if dhcpv6_was_enabled:
+            await locators.dhcpv6_capture.uncheck()
+    except Error as exc:
+        logger.error("Error applying unsaved changes: %s", exc)
+        raise AssertionError(
+            "Failed to apply unsaved changes to basic configuration."
+        ) from exc
+
+    # Verify that the unsaved changes are reflected in the UI
+    changed_values = await get_basic_config_snapshot(locators)
+    assert changed_values["polling_interval"] == "500", (
+        "Polling interval did not change to 500 as expected."
+    )
+    if dhcpv6_was_enabled:
+        assert (
+            changed_values["dhcpv6_enabled"] is False
+        ), "DHCPv6 checkbox should be unchecked after modification."
+
+    # Step 5 & 6: Click Reset and confirm
+    await trigger_reset_and_confirm(locators, baseline_config["polling_interval"])
+
+    # Step 7 & Expected results: verify values reverted to last saved configuration
+    # (trigger_reset_and_confirm already waited for the revert to land)
+    actual_values = await get_basic_config_snapshot(locators)
+
+    # Assertion: polling interval reverted
+    assert (
+        actual_values["polling_interval"] == baseline_config["polling_interval"]
+    ), (
+        "Polling interval did not revert to last saved value after Reset. "
+        f"Expected: {baseline_config['polling_interval']}, "
+        f"Found: {actual_values['polling_interval']}"
+    )
+
+    # Assertion: DHCPv6 checkbox reverted
+    assert actual_values["dhcpv6_enabled"] == baseline_config["dhcpv6_enabled"], (
+        "DHCPv6 checkbox state did not revert to last saved value after Reset. "
+        f"Expected: {baseline_config['dhcpv6_enabled']}, "
+        f"Found: {actual_values['dhcpv6_enabled']}"
+    )
+
+    # Additional check: ensure no changes were committed to system configuration
+    committed_values = await read_committed_config(locators)
+    assert committed_values == baseline_config, (
+        "System configuration appears to have changed after Reset, "
+        "but no Save Changes was performed. "
+        f"Expected: {baseline_config}, Found: {committed_values}"
+    )
+
+
+SCENARIOS = {
+    "save_persists": _save_persists,
+    "reset_reverts": _reset_reverts,
+}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("scenario", list(SCENARIOS))
+async def test_basic_profiler_configuration(
+    basic_config_page: Page,
+    scenario: str,
+) -> None:
+    """
+    TC_001 / TC_002: Save and reset the basic profiler configuration.
+
+    Both scenarios share the authenticated Basic Configuration page, its
+    locators and the navigation step, then branch:
+
+    - save_persists (TC_001): enable DHCPv6 options, save, and verify the
+      settings persist after reload.
+    - reset_reverts (TC_002): make unsaved changes, click Reset, and verify
+      the form reverts and nothing was committed.
+
+    Steps (shared):
+        1. Log in to the PPS admin console (handled by `basic_config_page` fixture).
+        2. Navigate to Profiler > Profiler Configuration > Settings > Basic Configuration.
+    """
+    page: Page = basic_config_page
+
+    # Locators are built once and shared by the helpers
+    # (update selectors in basic_config_helpers.py to match actual application DOM)
+    locators = BasicConfigLocators(page)
+
+    # ----------------------------------------------------------------------
+    # Step 1: Log in to the PPS admin console
+    # ----------------------------------------------------------------------
+    # This step is handled by the `basic_config_page` fixture, which has
+    # already finished loading, so a single read of the URL is enough.
+    url = page.url
+    if "https://" not in url or "admin" not in url:
+        logger.warning(
+            "Could not confirm admin URL pattern (%s); continuing with navigation.",
+            url,
+        )
+
+    # ----------------------------------------------------------------------
+    # Step 2: Navigate to Profiler > Profiler Configuration > Settings > Basic Configuration
+    # ----------------------------------------------------------------------
+    # basic_config_page normally starts on Basic Configuration already; wait
+    # for the form to be populated either way, since the scenarios read their
+    # baseline values from it.
+    try:
+        await wait_for_form_ready(locators)
+    except TimeoutError:
+        await navigate_to_basic_configuration(locators)
+
+    await SCENARIOS[scenario](locators)
@@ -1,15 +1,28 @@
 import asyncio
 import logging
-from typing import Optional
+import re
 
 import pytest
-from playwright.async_api import Page, Error, TimeoutError, expect
+from playwright.async_api import Dialog, Page, Error, TimeoutError, expect
+
+from basic_config_helpers import BasicConfigLocators, navigate_to_basic_configuration
 
 logger = logging.getLogger(__name__)
 
+# Status message text confirming the deletion or the missing configuration
+DELETION_MESSAGE_PATTERN = re.compile(
+    r"deleted|no profiler configured|needs configuration", re.I
+)
+
+# Any UI text indicating that no profiler is configured, matched in one DOM scan
+NO_PROFILER_PATTERN = re.compile(
+    r"no profiler( is)? configured|create profiler|configure profiler", re.I
+)
+
 
 @pytest.mark.asyncio
-async def test_delete_profiler_configuration_from_ui(authenticated_page: Page, browser):
+@pytest.mark.destructive
+async def test_delete_profiler_configuration_from_ui(authenticated_page: Page):
     """
     TC_003: Delete profiler configuration from UI
 
@@ -25,123 +38,116 @@ async def test_delete_profiler_configuration_from_ui(authenticated_page: Page, b
     """
     page: Page = authenticated_page
 
-    # Helper: wait for and accept confirmation dialog
-    async def accept_confirmation_dialog(expected_text_substring: Optional[str] = None) -> None:
-        """
-        Waits for a confirmation dialog and accepts it.
-
-        :param expected_text_substring: Optional substring to verify in dialog message.
-        """
-        dialog_future = asyncio.create_task(page.wait_for_event("dialog", timeout=5000))
-
-        try:
-            dialog = await dialog_future
-        except TimeoutError as exc:
-            logger.error("No confirmation dialog appeared within timeout.")
-            raise AssertionError("Expected a confirmation dialog, but none appeared.") from exc
-
-        try:
-            dialog_message = dialog.message
-            logger.info("Confirmation dialog appeared with message: %s", dialog_message)
-
-            if expected_text_substring:
-                assert expected_text_substring in dialog_message, (
-                    f"Dialog message did not contain expected text. "
-                    f"Expected to find '{expected_text_substring}', got '{dialog_message}'"
-                )
-
-            await dialog.accept()
-        except Error as exc:
-            logger.exception("Failed to accept confirmation dialog.")
-            raise AssertionError("Failed to accept confirmation dialog.") from exc
+    # Locators are built once and reused by every step (they resolve lazily)
+    locators = BasicConfigLocators(page)
+    lp01 = page.get_by_text("LP-01")
 
     # -------------------------------------------------------------------------
     # STEP 1: Navigate to Profiler > Profiler Configuration > Settings > Basic Configuration
     # -------------------------------------------------------------------------
     try:
-        # Example navigation using menu items; adjust selectors to your actual UI.
-        # Click "Profiler" in main navigation
-        await page.get_by_role("link", name="Profiler").click()
-
-        # Click "Profiler Configuration"
-        await page.get_by_role("link", name="Profiler Configuration").click()
-
-        # Click "Settings"
-        await page.get_by_role("link", name="Settings").click()
-
-        # Click "Basic Configuration"
-        await page.get_by_role("link", name="Basic Configuration").click()
+        # Loads BASIC_CONFIG_URL directly when configured and falls back to the
+        # Profiler > Profiler Configuration > Settings > Basic Configuration menus
+        await navigate_to_basic_configuration(locators)
 
         # Verify we are on the Basic Configuration page and LP-01 is visible
-        await expect(page.get_by_role("heading", name="Basic Configuration")).to_be_visible()
+        await expect(locators.header).to_be_visible()
         # Assuming LP-01 appears as a label or text on the page
-        await expect(page.get_by_text("LP-01")).to_be_visible()
-    except (Error, AssertionError) as exc:
+        await expect(lp01).to_be_visible()
+    except (Error, AssertionError):
         logger.exception("Failed to navigate to Basic Configuration or verify LP-01 presence.")
         raise
 
     # -------------------------------------------------------------------------
     # STEP 2: Click the "Delete Profiler" button
     # -------------------------------------------------------------------------
+    # Register the dialog handler before clicking: Playwright auto-dismisses
+    # dialogs that fire while no listener is attached.
+    dialog_message: "asyncio.Future[str]" = asyncio.get_running_loop().create_future()
+
+    async def accept_confirmation_dialog(dialog: Dialog) -> None:
+        """Accept the confirmation dialog and record its message for Step 3."""
+        try:
+            await dialog.accept()
+        except Error as exc:
+            logger.exception("Failed to accept confirmation dialog.")
+            if not dialog_message.done():
+                dialog_message.set_exception(
+                    AssertionError(f"Failed to accept confirmation dialog: {exc}")
+                )
+            return
+        if not dialog_message.done():
+            dialog_message.set_result(dialog.message)
+
+    page.once("dialog", accept_confirmation_dialog)
+
+    # Adjust the selector in basic_config_helpers.py to match the actual UI
+    delete_button = locators.delete_profiler
+
+    # The navigation listener is installed before the click so a fast redirect
+    # cannot complete unobserved. Some apps update in place instead, so a
+    # missing navigation is logged rather than treated as a failure.
     try:
-        # Adjust selector according to actual UI (text, role, id, etc.)
-        delete_button = page.get_by_role("button", name="Delete Profiler")
-        await expect(delete_button).to_be_enabled()
-        await delete_button.click()
-    except (Error, AssertionError) as exc:
-        logger.exception("Failed to click 'Delete Profiler' button.")
-        raise
+        async with page.expect_navigation(wait_until="domcontentloaded", timeout=15_000):
+            try:
+                # click() already waits for the button to be visible and enabled
+                await delete_button.click()
+            except Error as exc:
+                logger.exception("Failed to click 'Delete Profiler' button.")
+                raise AssertionError("Failed to click 'Delete Profiler' button.") from exc
+
+            # -----------------------------------------------------------------
+            # STEP 3: In the confirmation dialog, select Yes/OK to confirm deletion
+            # -----------------------------------------------------------------
+            # The handler registered above accepts it; the timeout only bounds
+            # the failure case where no dialog appears.
+            try:
+                message = await asyncio.wait_for(dialog_message, timeout=5)
+            except asyncio.TimeoutError as exc:
+                logger.error("No confirmation dialog appeared within timeout.")
+                raise AssertionError(
+                    "Expected a confirmation dialog, but none appeared."
+                ) from exc
+    except TimeoutError:
+        logger.info("No full page navigation detected after deletion; checking current page state.")
+        message = dialog_message.result()
 
-    # -------------------------------------------------------------------------
-    # STEP 3: In the confirmation dialog, select Yes/OK to confirm deletion
-    # -------------------------------------------------------------------------
-    await accept_confirmation_dialog(expected_text_substring="delete")
+    logger.info("Confirmation dialog appeared with message: %s", message)
+    assert "delete" in message, (
+        "Dialog message did not contain expected text. "
+        f"Expected to find 'delete', got '{message}'"
+    )
 
     # -------------------------------------------------------------------------
     # STEP 4: Observe system behavior and redirect
     # -------------------------------------------------------------------------
-    # Expect redirect to an overview or similar page and a success/info message
-    try:
-        # Wait for potential navigation after deletion
-        await page.wait_for_load_state("networkidle", timeout=15000)
-    except TimeoutError:
-        # Not necessarily a failure: some apps update in-place without full navigation
-        logger.info("No full page navigation detected after deletion; checking current page state.")
+    # Expect redirect to an overview or similar page (awaited around the
+    # delete click above) and a success/info message.
 
     # Example: expect a general notification message
     # Adjust to the actual selector for success/notification/toast message
     try:
         # This is intentionally flexible; adapt to your app's DOM
-        possible_message_locators = [
-            page.get_by_role("alert"),
-            page.locator(".alert-success"),
-            page.get_by_text("deleted").first,
-            page.get_by_text("no profiler configured", exact=False).first,
-        ]
-
-        message_found = False
-        for locator in possible_message_locators:
-            try:
-                await locator.wait_for(timeout=5000)
-                if await locator.is_visible():
-                    message_text = await locator.inner_text()
-                    logger.info("Status message after deletion: %s", message_text)
-                    # Basic assertion that message indicates deletion or missing configuration
-                    assert any(
-                        phrase.lower() in message_text.lower()
-                        for phrase in ["deleted", "no profiler configured", "needs configuration"]
-                    ), (
-                        "Status message does not clearly indicate deletion or missing configuration. "
-                        f"Message: {message_text}"
-                    )
-                    message_found = True
-                    break
-            except TimeoutError:
-                continue
-
-        assert message_found, (
-            "Expected a status/notification message after deletion, but none was found."
+        # One combined locator: Playwright's selector engine resolves whichever
+        # candidate matches first, so there is no Python-side race or loop.
+        message_locator = (
+            page.get_by_role("alert")
+            .or_(page.locator(".alert-success"))
+            .or_(page.get_by_text("deleted"))
+            .or_(page.get_by_text("no profiler configured"))
+            .first
         )
+        await expect(
+            message_locator,
+            "Expected a status/notification message after deletion, but none was found.",
+        ).to_be_visible(timeout=5000)
+
+        # Basic assertion that message indicates deletion or missing configuration
+        # (matched case-insensitively in the page, retrying like any expect)
+        await expect(
+            message_locator,
+            "Status message does not clearly indicate deletion or missing configuration.",
+        ).to_contain_text(DELETION_MESSAGE_PATTERN, timeout=5000)
     except AssertionError:
         logger.exception("Status message after deletion did not meet expectations.")
         raise
@@ -150,10 +156,10 @@ async def test_delete_profiler_configuration_from_ui(authenticated_page: Page, b
     # STEP 5: Try navigating back to Profiler > Profiler Configuration
     # -------------------------------------------------------------------------
     try:
-        await page.get_by_role("link", name="Profiler").click()
-        await page.get_by_role("link", name="Profiler Configuration").click()
-        await page.wait_for_load_state("networkidle", timeout=10000)
-    except (Error, TimeoutError) as exc:
+        await locators.profiler_menu.click()
+        await locators.profiler_config_menu.click()
+        await page.wait_for_load_state("domcontentloaded")
+    except (Error, TimeoutError):
         logger.exception("Failed to navigate back to Profiler Configuration after deletion.")
         raise
 
@@ -162,30 +168,18 @@ async def test_delete_profiler_configuration_from_ui(authenticated_page: Page, b
     # -------------------------------------------------------------------------
     # The UI should show no active profiler and/or prompt to create/configure a new profiler.
     try:
-        # Example 1: LP-01 should no longer be visible
-        lp01_locator = page.get_by_text("LP-01")
-        assert await lp01_locator.count() == 0 or not await lp01_locator.first.is_visible(), (
-            "Profiler configuration 'LP-01' still appears in the UI after deletion."
-        )
+        # Example 1: LP-01 should no longer be visible (retries until the
+        # deletion is reflected, in case the server removes it asynchronously)
+        await expect(
+            lp01,
+            "Profiler configuration 'LP-01' still appears in the UI after deletion.",
+        ).to_have_count(0, timeout=10_000)
 
         # Example 2: Look for text or control indicating no profiler is configured
-        no_profiler_text_candidates = [
-            "No profiler configured",
-            "No profiler is configured",
-            "Create Profiler",
-            "Configure Profiler",
-        ]
-
-        no_profiler_indicator_found = False
-        for text_candidate in no_profiler_text_candidates:
-            locator = page.get_by_text(text_candidate, exact=False)
-            if await locator.count() > 0 and await locator.first.is_visible():
-                no_profiler_indicator_found = True
-                break
-
-        assert no_profiler_indicator_found, (
-            "UI does not indicate that no profiler is configured or prompt to create/configure one."
-        )
-    except (Error, AssertionError) as exc:
+        await expect(
+            page.get_by_text(NO_PROFILER_PATTERN).first,
+            "UI does not indicate that no profiler is configured or prompt to create/configure one.",
+        ).to_be_visible()
+    except (Error, AssertionError):
         logger.exception("Post-deletion UI state did not match expectations.")
         raise
\ No newline at end of file
@@ -1,17 +1,52 @@
-import asyncio
 import logging
+import os
+import re
 from typing import Optional
 
 import pytest
-from playwright.async_api import Page, Browser, Error as PlaywrightError
+from playwright.async_api import (
+    Locator,
+    Page,
+    Error as PlaywrightError,
+    TimeoutError as PlaywrightTimeoutError,
+    expect,
+)
 
 logger = logging.getLogger(__name__)
 
+# Direct URL of the Advanced profiler configuration page (relative to the
+# context base_url). When unset, or if the direct load fails, the test
+# navigates through the menus.
+ADVANCED_CONFIG_URL = os.getenv("ADVANCED_CONFIG_URL", "")
+
+# Heading text of the Advanced configuration page ("Advanced Configuration"
+# or "Advanced Profiler Configuration")
+ADVANCED_HEADING_PATTERN = re.compile(r"Advanced( Profiler)? Configuration", re.I)
+
+# How long to wait for an optional checkbox before treating it as absent (ms)
+OPTIONAL_CHECKBOX_TIMEOUT = 1_000
+
+# Advanced data collector checkboxes set in Steps 4-6 and re-checked after
+# reload, keyed by label. Each selector is derived from its label so the two
+# cannot drift apart. Example selector; adjust to the actual DOM.
+CHECKBOX_SELECTOR = 'label:has-text("{label}") >> input[type="checkbox"]'
+COLLECTOR_CHECKBOXES = {
+    label: CHECKBOX_SELECTOR.format(label=label)
+    for label in (
+        "Enable WMI profiling",
+        "Enable SNMP collection",
+        "Enable CDP",
+        "Enable LLDP",
+    )
+}
+
 
 @pytest.mark.asyncio
+@pytest.mark.xdist_group("advanced_config")
+@pytest.mark.parametrize("description", list(COLLECTOR_CHECKBOXES))
 async def test_configure_advanced_profiler_settings_local_profiler(
     authenticated_page: Page,
-    browser: Browser,
+    description: str,
 ) -> None:
     """
     TC_004: Configure advanced profiler settings for local profiler (positive)
@@ -19,6 +54,12 @@ async def test_configure_advanced_profiler_settings_local_profiler(
     Validates that the advanced configuration for the local profiler can be
     accessed, updated, and persists after a page reload.
 
+    Parametrized over the data collector checkboxes: each case enables one
+    checkbox, saves and verifies it after reload, so a failure on one
+    collector does not hide the others. Cases whose checkbox is absent are
+    skipped. Every case saves the same Advanced form, so they must not run
+    concurrently: the `xdist_group` mark keeps them on one xdist worker.
+
     Prerequisites:
         - Basic profiler configuration already saved.
         - Admin logged in (handled by authenticated_page fixture).
@@ -27,9 +68,8 @@ async def test_configure_advanced_profiler_settings_local_profiler(
         1. Use authenticated_page as TPSAdmin.
         2. Navigate to Profiler > Profiler Configuration > Advance.
         3. Locate WMI configuration section.
-        4. Enable WMI profiling.
-        5. Enable SNMP collection (if present).
-        6. Enable CDP and LLDP (if present).
+        4-6. Enable the checkbox under test (WMI profiling, SNMP collection,
+             CDP or LLDP), if present.
         7. Click Save Changes.
         8. Validate success message and absence of error.
         9. Refresh and verify settings persist.
@@ -41,9 +81,15 @@ async def test_configure_advanced_profiler_settings_local_profiler(
     """
     page: Page = authenticated_page
 
+    # Locators are built once and reused by every step (they resolve lazily)
+    profiler_link = page.get_by_role("link", name="Profiler")
+    save_button = page.get_by_role("button", name="Save Changes")
+    wmi_text = page.get_by_text("WMI", exact=False)
+    checkbox = page.locator(COLLECTOR_CHECKBOXES[description]).first
+
     # Helper to safely click a checkbox if it exists
     async def ensure_checkbox_checked(
-        locator_str: str,
+        checkbox: Locator,
         description: str,
     ) -> Optional[bool]:
         """
@@ -54,19 +100,15 @@ async def test_configure_advanced_profiler_settings_local_profiler(
             False if already checked,
             None if the checkbox was not found.
         """
-        locator = page.locator(locator_str)
         try:
-            if not await locator.first().is_visible():
-                logger.info("Checkbox '%s' not visible; skipping.", description)
+            try:
+                is_checked = await checkbox.is_checked(timeout=OPTIONAL_CHECKBOX_TIMEOUT)
+            except PlaywrightTimeoutError:
+                logger.info("Checkbox '%s' not found; skipping.", description)
                 return None
-        except PlaywrightError:
-            logger.info("Checkbox '%s' not found; skipping.", description)
-            return None
 
-        try:
-            is_checked = await locator.first().is_checked()
             if not is_checked:
-                await locator.first().check()
+                await checkbox.check()
                 logger.info("Checkbox '%s' checked.", description)
                 return True
             logger.info("Checkbox '%s' already checked.", description)
@@ -79,20 +121,20 @@ async def test_configure_advanced_profiler_settings_local_profiler(
 
     # Helper to assert checkbox remains checked after reload
     async def assert_checkbox_checked(
-        locator_str: str,
+        checkbox: Locator,
         description: str,
     ) -> None:
-        locator = page.locator(locator_str)
+        """
+        Assert the checkbox under test is still checked after reload.
+
+        The checkbox was found before saving (otherwise the case is skipped),
+        so it must be present now; one retrying expect covers both presence
+        and state.
+        """
         try:
-            if not await locator.first().is_visible():
-                logger.info(
-                    "Checkbox '%s' not visible after reload; assuming optional.",
-                    description,
-                )
-                return
-            assert await locator.first().is_checked(), (
-                f"Checkbox '{description}' is not checked after reload."
-            )
+            await expect(
+                checkbox, f"Checkbox '{description}' is not checked after reload."
+            ).to_be_checked()
         except PlaywrightError as exc:
             logger.error(
                 "Failed to assert checkbox '%s' after reload: %s",
@@ -103,109 +145,96 @@ async def test_configure_advanced_profiler_settings_local_profiler(
                 f"Unable to verify checkbox '{description}' after reload: {exc}"
             )
 
-    # ----------------------------------------------------------------------
-    # Step 1: Use authenticated_page as TPSAdmin (fixture already logged in)
-    # ----------------------------------------------------------------------
-    # Basic sanity check: ensure we are on an authenticated page
-    try:
-        await page.wait_for_load_state("networkidle", timeout=15000)
-    except PlaywrightError as exc:
-        pytest.fail(f"Page did not reach network idle state after login: {exc}")
+    async def navigate_to_advanced_configuration() -> None:
+        """
+        Open the Advanced profiler configuration page.
 
-    # ----------------------------------------------------------------------
-    # Step 2: Navigate to Profiler > Profiler Configuration > Advance
-    # ----------------------------------------------------------------------
-    # NOTE: Selectors below are examples; adjust them to match the actual UI.
-    try:
+        Loads ADVANCED_CONFIG_URL directly when configured (one navigation
+        instead of three menu clicks) and falls back to the menu chain
+        otherwise. The page is ready once its Save Changes button renders.
+        """
+        if ADVANCED_CONFIG_URL:
+            try:
+                await page.goto(ADVANCED_CONFIG_URL, wait_until="domcontentloaded")
+                await save_button.wait_for(state="visible", timeout=10_000)
+                return
+            except PlaywrightError as exc:
+                logger.warning(
+                    "Direct navigation to %s failed (%s); using menu navigation.",
+                    ADVANCED_CONFIG_URL,
+                    exc,
+                )
+
+        # NOTE: Selectors below are examples; adjust them to match the actual UI.
         # Navigate via top menu: "Profiler"
-        await page.get_by_role("link", name="Profiler").click()
-        await page.wait_for_load_state("networkidle")
+        # (click() auto-waits for each next link, so no load-state waits between)
+        await profiler_link.click()
 
         # Submenu: "Profiler Configuration"
         await page.get_by_role("link", name="Profiler Configuration").click()
-        await page.wait_for_load_state("networkidle")
 
         # Tab or link: "Advance" (Advanced configuration)
         # Handle possible naming variations: "Advance" / "Advanced"
         advance_tab = page.get_by_role("link", name="Advance")
         advanced_tab = page.get_by_role("link", name="Advanced")
 
-        if await advance_tab.is_visible():
-            await advance_tab.click()
-        elif await advanced_tab.is_visible():
-            await advanced_tab.click()
-        else:
+        # Click whichever variant renders first
+        try:
+            await advance_tab.or_(advanced_tab).first.click()
+        except PlaywrightError:
             pytest.fail(
                 "Could not find 'Advance' or 'Advanced' configuration tab."
             )
 
-        await page.wait_for_load_state("networkidle")
-    except PlaywrightError as exc:
-        pytest.fail(f"Navigation to advanced profiler configuration failed: {exc}")
+        await expect(save_button).to_be_visible()
 
     # ----------------------------------------------------------------------
-    # Step 3: Locate WMI configuration section
+    # Step 1: Use authenticated_page as TPSAdmin (fixture already logged in)
     # ----------------------------------------------------------------------
-    # This step is primarily a visibility/assertion step.
-    # Adjust selectors to match the real application.
+    # Basic sanity check: ensure we are on an authenticated page, keyed to the
+    # first element the test interacts with rather than network idle
     try:
-        wmi_section = page.get_by_role("group", name="WMI Configuration")
-        # Fallback to a heading if group role is not available
-        if not await wmi_section.is_visible():
-            wmi_section = page.get_by_role("heading", name="WMI Configuration")
-        assert await wmi_section.is_visible(), (
-            "WMI configuration section is not visible on Advanced page."
-        )
-    except PlaywrightError:
-        # If roles are not properly defined, fall back to text search
-        wmi_section = page.get_by_text("WMI", exact=False)
-        if not await wmi_section.is_visible():
-            pytest.fail(
-                "Unable to locate WMI configuration section on Advanced page."
-            )
+        await expect(profiler_link).to_be_visible(timeout=15000)
+    except (AssertionError, PlaywrightError) as exc:
+        pytest.fail(f"Authenticated page did not show the Profiler menu: {exc}")
 
     # ----------------------------------------------------------------------
-    # Step 4: Check “Enable WMI profiling”
+    # Step 2: Navigate to Profiler > Profiler Configuration > Advance
     # ----------------------------------------------------------------------
-    # Example selector assumptions:
-    # - Checkbox input with label text "Enable WMI profiling"
-    # You may need to adjust to match actual DOM:
-    #   label:has-text("Enable WMI profiling") >> input[type="checkbox"]
-    await ensure_checkbox_checked(
-        locator_str='label:has-text("Enable WMI profiling") >> input[type="checkbox"]',
-        description="Enable WMI profiling",
-    )
+    try:
+        await navigate_to_advanced_configuration()
+    except PlaywrightError as exc:
+        pytest.fail(f"Navigation to advanced profiler configuration failed: {exc}")
 
     # ----------------------------------------------------------------------
-    # Step 5: Check “Enable SNMP collection” (if present)
+    # Step 3: Locate WMI configuration section
     # ----------------------------------------------------------------------
-    await ensure_checkbox_checked(
-        locator_str='label:has-text("Enable SNMP collection") >> input[type="checkbox"]',
-        description="Enable SNMP collection",
+    # This step is primarily a visibility/assertion step.
+    # Adjust selectors to match the real application. The group role, heading
+    # and plain-text fallbacks are combined into one locator and awaited once.
+    wmi_section = (
+        page.get_by_role("group", name="WMI Configuration")
+        .or_(page.get_by_role("heading", name="WMI Configuration"))
+        .or_(wmi_text)
     )
+    try:
+        await expect(wmi_section.first).to_be_visible()
+    except AssertionError:
+        pytest.fail("Unable to locate WMI configuration section on Advanced page.")
 
     # ----------------------------------------------------------------------
-    # Step 6: Check “Enable CDP” and “Enable LLDP” (if present)
+    # Steps 4-6: Check the checkbox under test (if present)
     # ----------------------------------------------------------------------
-    await ensure_checkbox_checked(
-        locator_str='label:has-text("Enable CDP") >> input[type="checkbox"]',
-        description="Enable CDP",
-    )
-
-    await ensure_checkbox_checked(
-        locator_str='label:has-text("Enable LLDP") >> input[type="checkbox"]',
-        description="Enable LLDP",
-    )
+    # Selectors live in COLLECTOR_CHECKBOXES; adjust them to the actual DOM.
+    if await ensure_checkbox_checked(checkbox, description) is None:
+        pytest.skip(f"Checkbox '{description}' is not present on this system.")
 
     # ----------------------------------------------------------------------
     # Step 7: Click `Save Changes`
     # ----------------------------------------------------------------------
     # Adjust selector to actual button text or id as needed.
     try:
-        save_button = page.get_by_role("button", name="Save Changes")
-        assert await save_button.is_visible(), (
-            "'Save Changes' button is not visible on Advanced configuration page."
-        )
+        # click() already waits for the button to be visible and enabled
         await save_button.click()
     except PlaywrightError as exc:
         pytest.fail(f"Failed to click 'Save Changes' button: {exc}")
@@ -216,20 +245,25 @@ async def test_configure_advanced_profiler_settings_local_profiler(
     try:
         # Example success message locator
         # Adjust text to match actual success message.
-        success_message = page.locator(
-            ".alert-success, .msg-success, text=Settings saved successfully"
+        success_message = (
+            page.locator(".alert-success")
+            .or_(page.locator(".msg-success"))
+            .or_(page.get_by_text("Settings saved successfully"))
         )
 
-        await success_message.wait_for(timeout=15000)
-        assert await success_message.is_visible(), (
-            "Success message not visible after saving advanced configuration."
-        )
+        await expect(
+            success_message.first,
+            "Success message not visible after saving advanced configuration.",
+        ).to_be_visible(timeout=15000)
 
         # Assert no visible error messages
-        error_message = page.locator(
-            ".alert-error, .msg-error, .validation-error, text=Error"
+        error_message = (
+            page.locator(".alert-error")
+            .or_(page.locator(".msg-error"))
+            .or_(page.locator(".validation-error"))
+            .or_(page.get_by_text("Error"))
         )
-        assert not await error_message.is_visible(), (
+        assert not await error_message.first.is_visible(), (
             "An error message is visible after saving advanced configuration."
         )
     except PlaywrightError as exc:
@@ -241,47 +275,24 @@ async def test_configure_advanced_profiler_settings_local_profiler(
     # Step 9: Refresh the page and verify settings persist
     # ----------------------------------------------------------------------
     try:
-        await page.reload(wait_until="networkidle")
-    except PlaywrightError as exc:
+        await page.reload(wait_until="domcontentloaded")
+        await expect(wmi_text.first).to_be_visible()
+    except (AssertionError, PlaywrightError) as exc:
         pytest.fail(f"Failed to reload Advanced configuration page: {exc}")
 
     # Re-assert that we are still on the Advanced configuration page
-    # (lightweight check, adjust as needed)
-    try:
-        assert await page.get_by_text("Advanced Profiler Configuration", exact=False).is_visible() or \
-               await page.get_by_text("Advanced Configuration", exact=False).is_visible(), \
-            "Not on Advanced configuration page after reload."
-    except PlaywrightError:
-        # If headings are different, we skip this soft check
-        logger.warning(
-            "Could not verify advanced configuration heading after reload; "
-            "continuing with checkbox validations."
-        )
+    # (lightweight check, adjust as needed). A single retrying assertion
+    # replaces the two one-shot is_visible() probes.
+    await expect(
+        page.get_by_text(ADVANCED_HEADING_PATTERN).first,
+        "Not on Advanced configuration page after reload.",
+    ).to_be_visible(timeout=10_000)
 
-    # Verify that all relevant checkboxes remain checked
-    await assert_checkbox_checked(
-        locator_str='label:has-text("Enable WMI profiling") >> input[type="checkbox"]',
-        description="Enable WMI profiling",
-    )
-
-    await assert_checkbox_checked(
-        locator_str='label:has-text("Enable SNMP collection") >> input[type="checkbox"]',
-        description="Enable SNMP collection",
-    )
-
-    await assert_checkbox_checked(
-        locator_str='label:has-text("Enable CDP") >> input[type="checkbox"]',
-        description="Enable CDP",
-    )
-
-    await assert_checkbox_checked(
-        locator_str='label:has-text("Enable LLDP") >> input[type="checkbox"]',
-        description="Enable LLDP",
-    )
+    # Verify that the checkbox remains checked
+    await assert_checkbox_checked(checkbox, description)
 
     # If we reached this point, all assertions have passed and the test
     # confirms that the advanced settings were saved and persisted.
     # Postconditions:
     # - Local profiler operates with newly enabled advanced data collectors.
     # (Behavioral verification is out of scope for this UI test.)
-    await asyncio.sleep(0)  # keep function async-friendly even if simplified
\ No newline at end of file
@@ -1,9 +1,8 @@
-import asyncio
 import logging
 from typing import List
 
 import pytest
-from playwright.async_api import Page, Error as PlaywrightError
+from playwright.async_api import Locator, Page, Error as PlaywrightError, expect
 
 logger = logging.getLogger(__name__)
 
@@ -11,7 +10,6 @@ logger = logging.getLogger(__name__)
 @pytest.mark.asyncio
 async def test_enable_additional_data_collectors_ldap_mdm(
     authenticated_page: Page,
-    browser,
 ) -> None:
     """
     TC_006: Enable additional data collectors (LDAP and MDM)
@@ -54,9 +52,20 @@ async def test_enable_additional_data_collectors_ldap_mdm(
     mdm_move_to_selected_button_selector = "button#mdm-add"
 
     save_changes_button_selector = "button:has-text('Save Changes')"
-    success_message_selector = ".alert-success, .message-success, text=Success"
+    success_message_selector = ".alert-success, .message-success"
     error_message_selector = ".alert-danger, .message-error, .validation-error"
 
+    # `text=` cannot be mixed into a CSS list, so the text match is joined with
+    # or_; one wait then resolves to whichever candidate appears first.
+    success_message = (
+        page.locator(success_message_selector).or_(page.get_by_text("Success")).first
+    )
+    error_message = page.locator(error_message_selector).first
+
+    def selected_option(selected_selector: str, option_label: str) -> Locator:
+        """Locate the <option> with exactly `option_label` in a selected list."""
+        return page.locator(selected_selector).locator(f"option:text-is('{option_label}')")
+
     async def select_option_and_move(
         available_selector: str,
         selected_selector: str,
@@ -88,14 +97,11 @@ async def test_enable_additional_data_collectors_ldap_mdm(
             await page.click(move_button_selector)
 
             # Verify the option is now in the selected list
-            selected_options: List[str] = await page.eval_on_selector(
-                selected_selector,
-                """(select) => Array.from(select.options).map(o => o.textContent.trim())""",
-            )
-            assert option_label in selected_options, (
+            await expect(
+                selected_option(selected_selector, option_label),
                 f"Option '{option_label}' was not moved to selected list "
-                f"({selected_selector}). Selected: {selected_options}"
-            )
+                f"({selected_selector})",
+            ).to_be_attached()
 
         except PlaywrightError as exc:
             logger.error(
@@ -112,15 +118,11 @@ async def test_enable_additional_data_collectors_ldap_mdm(
         option_label: str,
     ) -> None:
         """Assert that an option is present in the selected list."""
-        await page.wait_for_selector(selected_selector, state="visible", timeout=10000)
-        selected_options: List[str] = await page.eval_on_selector(
-            selected_selector,
-            """(select) => Array.from(select.options).map(o => o.textContent.trim())""",
-        )
-        assert option_label in selected_options, (
+        await expect(
+            selected_option(selected_selector, option_label),
             f"Option '{option_label}' not present in selected list "
-            f"({selected_selector}) after reload. Selected: {selected_options}"
-        )
+            f"({selected_selector}) after reload",
+        ).to_be_attached(timeout=10000)
 
     # -------------------------------------------------------------------------
     # Step 1: Navigate to Profiler > Profiler Configuration > Additional Data Collectors
@@ -184,27 +186,17 @@ async def test_enable_additional_data_collectors_ldap_mdm(
     # -------------------------------------------------------------------------
     try:
         # Wait for either success or error message to appear
-        success_or_error = await asyncio.wait_for(
-            asyncio.gather(
-                page.wait_for_selector(success_message_selector, timeout=15000),
-                return_exceptions=True,
-            ),
-            timeout=16000,
-        )
-    except asyncio.TimeoutError:
-        success_or_error = [None]
-
-    # Check for explicit error messages first
-    error_visible = await page.is_visible(error_message_selector)
+        await expect(success_message.or_(error_message).first).to_be_visible(timeout=15000)
+    except AssertionError as exc:
+        raise AssertionError(
+            "Expected a success message after saving additional data collectors, "
+            "but none was found."
+        ) from exc
+
+    # One of the two is visible; an error message means the save failed
+    error_visible = await error_message.is_visible()
     assert not error_visible, "Validation or connectivity error message is visible after save."
 
-    # Check success message
-    success_visible = await page.is_visible(success_message_selector)
-    assert success_visible, (
-        "Expected a success message after saving additional data collectors, "
-        "but none was found."
-    )
-
     # -------------------------------------------------------------------------
     # Step 6: Reload the page and verify both servers remain in selected lists
     # -------------------------------------------------------------------------
@@ -4,6 +4,7 @@ Generates Playwright-based automated test scripts using GPT-5 Codex
 """
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional
 from openai import AzureOpenAI
@@ -15,7 +16,8 @@ from config import (
     CODEX_API_VERSION,
     SCRIPT_MAX_TOKENS,
     SCRIPT_TEMPERATURE,
-    DATA_DIR
+    DATA_DIR,
+    MAX_WORKERS
 )
 from src.utils.logger import setup_logger
 
@@ -88,34 +90,48 @@ class ScriptGenerator:
             # Get framework code from RAG
             framework_code = self._retrieve_framework_code(user_prompt, test_cases_list)
 
-            # Generate configuration script
-            config_script = self._generate_config_script(
-                target_config,
-                test_cases_list,
-                framework_code
-            )
-
-            # Save configuration script
-            config_file = scripts_dir / 'conftest.py'
-            with open(config_file, 'w', encoding='utf-8') as f:
-                f.write(config_script)
-
-            # Generate individual test scripts
+            # Generate configuration script and individual test scripts concurrently.
+            # Each is an independent LLM call; MAX_WORKERS bounds in-flight requests
+            # to stay under the deployment's rate limit.
             test_files = {}
-            for i, test_case in enumerate(test_cases_list):
-                test_script = self._generate_test_script(
-                    test_case,
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                config_future = executor.submit(
+                    self._generate_config_script,
                     target_config,
-                    framework_code,
-                    i + 1
+                    test_cases_list,
+                    framework_code
                 )
-
-                # Save test script
-                test_file = scripts_dir / f"test_{test_case['id'].lower()}.py"
-                with open(test_file, 'w', encoding='utf-8') as f:
-                    f.write(test_script)
-
-                test_files[test_case['id']] = str(test_file)
+                script_futures = [
+                    executor.submit(
+                        self._generate_test_script,
+                        test_case,
+                        target_config,
+                        framework_code,
+                        i + 1
+                    )
+                    for i, test_case in enumerate(test_cases_list)
+                ]
+
+                try:
+                    # Save configuration script
+                    config_script = config_future.result()
+                    config_file = scripts_dir / 'conftest.py'
+                    with open(config_file, 'w', encoding='utf-8') as f:
+                        f.write(config_script)
+
+                    # Save test scripts in test case order
+                    for test_case, future in zip(test_cases_list, script_futures):
+                        test_script = future.result()
+                        test_file = scripts_dir / f"test_{test_case['id'].lower()}.py"
+                        with open(test_file, 'w', encoding='utf-8') as f:
+                            f.write(test_script)
+
+                        test_files[test_case['id']] = str(test_file)
+                except Exception:
+                    # Don't start calls that haven't begun once the job has failed
+                    for future in script_futures:
+                        future.cancel()
+                    raise
 
             # Generate requirements.txt
             requirements_content = self._generate_requirements()
@@ -4,6 +4,7 @@ Provides unified interface for Azure OpenAI GPT-4.1-nano
 """
 import os
 import sys
+import threading
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 
@@ -13,9 +14,16 @@ sys.path.insert(0, str(project_root))
 
 import config
 from src.utils.logger import setup_logger
-from openai import AzureOpenAI
+from openai import AzureOpenAI, DEFAULT_TIMEOUT, DEFAULT_CONNECTION_LIMITS
 from langchain_openai import AzureChatOpenAI
 
+try:
+    import h2  # noqa: F401  (enables HTTP/2 support in httpx)
+    import httpx
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 logger = setup_logger(__name__)
 
 
@@ -181,6 +189,9 @@ class AzureLLM:
 
 # Global LLM instance (singleton pattern)
 _llm_instance = None
+# Flask serves requests on several threads; the lock keeps concurrent first
+# calls from building duplicate instances.
+_llm_instance_lock = threading.Lock()
 
 def get_azure_llm() -> AzureLLM:
     """
@@ -191,5 +202,45 @@ def get_azure_llm() -> AzureLLM:
     """
     global _llm_instance
     if _llm_instance is None:
-        _llm_instance = AzureLLM()
+        with _llm_instance_lock:
+            # Re-check: another request thread may have created it meanwhile
+            if _llm_instance is None:
+                _llm_instance = AzureLLM()
     return _llm_instance
+
+
+# Shared Azure OpenAI client (singleton pattern)
+_openai_client = None
+_openai_client_lock = threading.Lock()
+
+def get_openai_client() -> AzureOpenAI:
+    """
+    Get global Azure OpenAI client (singleton)
+
+    Reusing one client keeps its HTTP connection pool alive, so calls
+    don't pay a fresh TCP/TLS handshake each time.
+
+    Returns:
+        AzureOpenAI client configured from config.py
+    """
+    global _openai_client
+    if _openai_client is None:
+        with _openai_client_lock:
+            # Re-check: another request thread may have created it meanwhile
+            if _openai_client is None:
+                http_client = None
+                if HTTP2_AVAILABLE:
+                    # HTTP/2 multiplexes concurrent requests over one connection
+                    http_client = httpx.Client(
+                        http2=True,
+                        timeout=DEFAULT_TIMEOUT,
+                        limits=DEFAULT_CONNECTION_LIMITS,
+                        follow_redirects=True
+                    )
+                _openai_client = AzureOpenAI(
+                    api_version=config.AZURE_OPENAI_API_VERSION,
+                    azure_endpoint=config.AZURE_OPENAI_ENDPOINT,
+                    api_key=config.AZURE_OPENAI_API_KEY,
+                    http_client=http_client
+                )
+    return _openai_client
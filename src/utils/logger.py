@@ -24,6 +24,7 @@ def setup_logger(name: str) -> logging.Logger:
         return logger
 
     # File handler
+    config.init_storage()
     file_handler = logging.FileHandler(config.LOG_FILE, encoding='utf-8')
     file_handler.setLevel(logging.DEBUG)
     file_formatter = logging.Formatter(config.LOG_FORMAT)
@@ -7,13 +7,14 @@ Enterprise Vector Store with Advanced Features
 - Hybrid search support
 """
 import os
+import re
 import pickle
+import hashlib
 import faiss
 import numpy as np
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass, asdict
 from datetime import datetime
-from sentence_transformers import SentenceTransformer
 import config
 from src.utils.logger import setup_logger
 from src.utils.text_splitter import Chunk
@@ -67,12 +68,21 @@ class VectorStore:
         metadata_path: str = str(config.CHUNK_METADATA_PATH),
         registry_path: str = str(config.DOC_REGISTRY_PATH),
         embedding_model: str = config.EMBED_MODEL_NAME,
-        dimension: int = config.EMBED_DIM
+        dimension: int = config.EMBED_DIM,
+        query_cache_dir: str = str(config.QUERY_EMBEDDING_CACHE_DIR),
+        query_cache_max_files: int = config.QUERY_EMBEDDING_CACHE_MAX_FILES
     ):
         self.index_path = index_path
         self.metadata_path = metadata_path
         self.registry_path = registry_path
         self.dimension = dimension
+        self.embedding_model_name = embedding_model
+        # One cache directory per embedding model, so switching models never
+        # serves vectors produced by another one
+        model_dir = re.sub(r'[^A-Za-z0-9._-]', '_', embedding_model)
+        self.query_cache_dir = os.path.join(query_cache_dir, model_dir)
+        self.query_cache_max_files = query_cache_max_files
+        config.init_storage()
 
         # Initialize FAISS index
         self.index = self._load_or_create_index()
@@ -81,9 +91,24 @@ class VectorStore:
         self.chunk_metadata: Dict[int, ChunkMetadata] = self._load_metadata()
         self.doc_registry: Dict[str, DocumentRegistry] = self._load_registry()
 
-        # Load embedding model
-        logger.info(f"Loading embedding model: {embedding_model}")
-        self.embedding_model = SentenceTransformer(embedding_model)
+        # Embedding model is loaded on first use (see embedding_model property)
+        self._embedding_model = None
+
+    @property
+    def embedding_model(self):
+        """
+        SentenceTransformer model, imported and loaded on first access
+
+        sentence-transformers pulls in torch, which dominates startup time.
+        Deferring it lets the app and CLI tools start without paying that
+        cost until something is actually embedded.
+        """
+        if self._embedding_model is None:
+            from sentence_transformers import SentenceTransformer
+
+            logger.info(f"Loading embedding model: {self.embedding_model_name}")
+            self._embedding_model = SentenceTransformer(self.embedding_model_name)
+        return self._embedding_model
 
     def _load_or_create_index(self) -> faiss.Index:
         """Load existing FAISS index or create new one"""
@@ -98,6 +123,58 @@ class VectorStore:
             self._save_index(index)
             return index
 
+    def _embed_query(self, query: str) -> np.ndarray:
+        """
+        Embed a query, reusing a memory-mapped on-disk copy when available
+
+        Vectors are keyed by blake2b(model name + query) inside a per-model
+        directory, so they survive restarts and are never shared across
+        embedding models. The directory holds at most query_cache_max_files
+        vectors; the least recently used ones are evicted.
+
+        Args:
+            query: Query text
+
+        Returns:
+            float32 array of shape (1, dimension)
+        """
+        key = hashlib.blake2b(
+            f"{self.embedding_model_name}\0{query}".encode('utf-8'), digest_size=16
+        ).hexdigest()
+        cache_path = os.path.join(self.query_cache_dir, f"{key}.npy")
+
+        if os.path.exists(cache_path):
+            try:
+                embedding = np.load(cache_path, mmap_mode='r')
+                os.utime(cache_path)  # Mark as recently used for eviction
+                return embedding
+            except (OSError, ValueError) as e:
+                logger.warning(f"Discarding unreadable query embedding cache {cache_path}: {e}")
+
+        embedding = self.embedding_model.encode([query]).astype('float32')
+        try:
+            os.makedirs(self.query_cache_dir, exist_ok=True)
+            np.save(cache_path, embedding)
+            self._evict_query_cache()
+        except OSError as e:
+            logger.warning(f"Could not cache query embedding: {e}")
+        return embedding
+
+    def _evict_query_cache(self):
+        """Delete the least recently used query vectors beyond query_cache_max_files"""
+        with os.scandir(self.query_cache_dir) as entries:
+            files = [entry for entry in entries if entry.name.endswith('.npy')]
+        excess = len(files) - self.query_cache_max_files
+        if excess <= 0:
+            return
+        files.sort(key=lambda entry: entry.stat().st_mtime)
+        for entry in files[:excess]:
+            try:
+                os.remove(entry.path)
+            except OSError as e:
+                # e.g. still memory-mapped on Windows; retried on the next write
+                logger.debug(f"Could not evict query embedding {entry.path}: {e}")
+
     def _save_index(self, index: faiss.Index = None):
         """Save FAISS index to disk"""
         if index is None:
@@ -258,7 +335,7 @@ class VectorStore:
             return []
 
         # Generate query embedding
-        query_embedding = self.embedding_model.encode([query]).astype('float32')
+        query_embedding = self._embed_query(query)
 
         # Search in FAISS
         distances, indices = self.index.search(query_embedding, k)